@@ -1,9 +1,11 @@
 """Tests for agent node functionality (SPEC-3)."""
 
+import json
 import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from trident.executor import run
 from trident.parser import AgentNode, MCPServerConfig, OutputSchema, PromptNode
@@ -137,6 +139,28 @@ That's all!"""
         result = _parse_json_response(text)
         self.assertEqual(result["key"], "value")
 
+    def test_parse_embedded_object(self):
+        """The first object in prose is found; braces inside strings are ignored."""
+        from trident.agents import _parse_json_response
+
+        text = 'Output: {"note": "use } and \\" freely", "n": {"x": 1}} and {"later": 2}'
+        result = _parse_json_response(text)
+        self.assertEqual(result, {"note": 'use } and " freely', "n": {"x": 1}})
+
+    def test_parse_embedded_object_skips_stray_braces(self):
+        """Braces that don't start valid JSON are skipped."""
+        from trident.agents import _parse_json_response
+
+        result = _parse_json_response('Set {name} in the config: {"name": "trident"}')
+        self.assertEqual(result, {"name": "trident"})
+
+    def test_parse_truncated_embedded_object_raises(self):
+        """A truncated object raises instead of yielding a nested fragment."""
+        from trident.agents import _parse_json_response
+
+        with self.assertRaises(json.JSONDecodeError):
+            _parse_json_response('Here: {"summary": {"score": 3}, "items": [1, 2,')
+
     def test_parse_array_wrapped(self):
         """Top-level arrays are wrapped in dict."""
         from trident.agents import _parse_json_response
@@ -146,8 +170,6 @@ That's all!"""
 
     def test_parse_invalid_json_raises(self):
         """Invalid JSON raises JSONDecodeError."""
-        import json
-
         from trident.agents import _parse_json_response
 
         with self.assertRaises(json.JSONDecodeError):
@@ -269,6 +291,86 @@ class TestJsonSchemaBuilder(unittest.TestCase):
         self.assertNotIn("description", schema["properties"]["result"])
 
 
+class TestCLIAvailability(unittest.TestCase):
+    """Tests for locating the Claude CLI."""
+
+    def test_check_cli_available_follows_path(self):
+        """The lookup is cached per PATH value, so PATH changes are still seen."""
+        from trident.cli_agents import CLIAgentError, check_cli_available
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cli = Path(tmpdir) / "claude"
+            cli.write_text("#!/bin/sh\n")
+            cli.chmod(0o755)
+
+            with mock.patch.dict(os.environ, {"PATH": tmpdir}):
+                self.assertEqual(check_cli_available(), str(cli))
+                self.assertEqual(check_cli_available(), str(cli))
+
+            with (
+                mock.patch.dict(os.environ, {"PATH": str(Path(tmpdir) / "empty")}),
+                self.assertRaises(CLIAgentError),
+            ):
+                check_cli_available()
+
+
+class TestExecuteAgentRunner(unittest.TestCase):
+    """Tests for the synchronous agent wrapper."""
+
+    def test_execute_agent_closes_event_loop(self):
+        """Each call runs on its own event loop, closed before returning."""
+        import asyncio
+
+        from trident import agents
+
+        async def fake_execute(*args):
+            return asyncio.get_running_loop()
+
+        with (
+            mock.patch.object(agents, "check_sdk_available"),
+            mock.patch.object(agents, "execute_agent_async", fake_execute),
+        ):
+            node = AgentNode(id="agent", prompt_path="prompts/agent.prompt")
+            first = agents.execute_agent(node, {}, ".")
+            second = agents.execute_agent(node, {}, ".")
+
+        self.assertIsNot(first, second)
+        self.assertTrue(first.is_closed())
+        self.assertTrue(second.is_closed())
+
+
+class TestMCPServerConfigBuilder(unittest.TestCase):
+    """Tests for building MCP server configs."""
+
+    def test_build_mcp_servers_expands_env(self):
+        """${VAR} values come from the environment; servers without env omit it."""
+        from trident.cli_agents import _build_mcp_config
+
+        servers = {
+            "github": MCPServerConfig(
+                command="npx",
+                args=["server-github"],
+                env={"TOKEN": "${TEST_MCP_TOKEN}", "MISSING": "${TEST_MCP_UNSET}", "MODE": "ro"},
+            ),
+            "plain": MCPServerConfig(command="mcp-plain"),
+        }
+
+        with mock.patch.dict(os.environ, {"TEST_MCP_TOKEN": "secret"}):
+            config = _build_mcp_config(servers)
+
+        self.assertEqual(
+            config["mcpServers"],
+            {
+                "github": {
+                    "command": "npx",
+                    "args": ["server-github"],
+                    "env": {"TOKEN": "secret", "MISSING": "", "MODE": "ro"},
+                },
+                "plain": {"command": "mcp-plain", "args": []},
+            },
+        )
+
+
 class TestAgentInDAG(unittest.TestCase):
     """Tests for agent nodes in DAG structure."""
 
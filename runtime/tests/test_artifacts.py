@@ -4,7 +4,9 @@ import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
+from trident import fastjson
 from trident.artifacts import (
     ArtifactConfig,
     ArtifactManager,
@@ -14,6 +16,7 @@ from trident.artifacts import (
     RunMetadata,
     find_latest_run,
     get_artifact_manager,
+    resolve_input_source,
 )
 from trident.executor import Checkpoint, CheckpointNodeData, ExecutionTrace, NodeTrace
 
@@ -51,6 +54,43 @@ class TestRunManifest(unittest.TestCase):
             self.assertEqual(loaded.runs[0].run_id, "test-run-1")
             self.assertTrue(loaded.runs[0].success)
 
+    def test_load_tail(self):
+        """load_tail returns the newest runs first along with the total count."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manifest_path = Path(tmpdir) / "manifest.json"
+            self.assertEqual(RunManifest.load_tail(manifest_path, 3), ([], 0))
+
+            manifest = RunManifest()
+            for i in range(5):
+                manifest.add_run(
+                    RunEntry(
+                        run_id=f"run-{i}",
+                        project_name="test-project",
+                        entrypoint="input",
+                        status="completed",
+                        started_at=f"2024-01-01T00:0{i}:00Z",
+                    )
+                )
+            manifest.save(manifest_path)
+
+            entries, total = RunManifest.load_tail(manifest_path, 3)
+            self.assertEqual([e.run_id for e in entries], ["run-4", "run-3", "run-2"])
+            self.assertEqual(total, 5)
+            self.assertEqual(RunManifest.load_tail(manifest_path, 0), ([], 5))
+
+    def test_load_tail_corrupted_manifest(self):
+        """load_tail treats undecodable or non-object manifests as empty."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manifest_path = Path(tmpdir) / "manifest.json"
+            for content in (b"\xff\xfe{}", b"[]", b'{"runs": [1]}'):
+                for orjson in (fastjson.orjson, None):
+                    with (
+                        self.subTest(content=content, orjson=orjson is not None),
+                        mock.patch.object(fastjson, "orjson", orjson),
+                    ):
+                        manifest_path.write_bytes(content)
+                        self.assertEqual(RunManifest.load_tail(manifest_path, 3), ([], 0))
+
     def test_get_latest(self):
         """get_latest returns most recent run."""
         manifest = RunManifest()
@@ -366,6 +406,43 @@ class TestFindLatestRun(unittest.TestCase):
             latest = find_latest_run(project_root)
             self.assertEqual(latest, "run-2")
 
+    def test_find_latest_run_follows_latest_pointer(self):
+        """register_run keeps the latest pointer current; stale pointers fall back."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            for run_id in ("run-1", "run-2"):
+                manager = get_artifact_manager(project_root, run_id)
+                manager.ensure_dirs()
+                manager.register_run("test", None)
+
+            self.assertEqual(manager.latest_path.read_text(), "run-2")
+            self.assertEqual(find_latest_run(project_root), "run-2")
+
+            # Re-registering an older run does not move the pointer
+            get_artifact_manager(project_root, "run-1").register_run("test", None)
+            self.assertEqual(find_latest_run(project_root), "run-2")
+
+            # A stale pointer (run directory deleted) defers to the manifest
+            manager.latest_path.write_text("gone")
+            self.assertEqual(find_latest_run(project_root), "run-2")
+
+    def test_latest_pointer_does_not_collide_with_run_id(self):
+        """A run named "latest" gets its own directory, not the previous run's."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            first = get_artifact_manager(project_root, "run-1")
+            first.ensure_dirs()
+            first.register_run("test", None)
+
+            manager = get_artifact_manager(project_root, "latest")
+            manager.ensure_dirs()
+            (manager.run_dir / "outputs.json").write_text("{}")
+            manager.register_run("test", None)
+
+            self.assertFalse(manager.run_dir.is_symlink())
+            self.assertFalse((first.run_dir / "outputs.json").exists())
+            self.assertEqual(find_latest_run(project_root), "latest")
+
     def test_find_latest_run_no_runs(self):
         """find_latest_run returns None when no runs exist."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -373,6 +450,23 @@ class TestFindLatestRun(unittest.TestCase):
             self.assertIsNone(latest)
 
 
+class TestResolveInputSource(unittest.TestCase):
+    """Tests for resolve_input_source function."""
+
+    def test_resolve_alias_and_invalid_json(self):
+        """Aliases load published outputs; bad JSON raises json.JSONDecodeError."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            outputs_dir = project_root / ".trident" / "outputs"
+            outputs_dir.mkdir(parents=True)
+            (outputs_dir / "report.json").write_text('{"score": 3}')
+            (project_root / "broken.json").write_text("{not json")
+
+            self.assertEqual(resolve_input_source("alias:report", project_root), {"score": 3})
+            with self.assertRaises(json.JSONDecodeError):
+                resolve_input_source("broken.json", project_root)
+
+
 class TestGetArtifactManager(unittest.TestCase):
     """Tests for get_artifact_manager function."""
 
@@ -2,6 +2,7 @@
 
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from trident.dag import (
     DAGError,
@@ -647,6 +648,33 @@ class TestTypeValidationIntegration(unittest.TestCase):
         type_warnings = [w for w in result.warnings if "Type mismatch" in w.message]
         self.assertEqual(len(type_warnings), 0)
 
+    def test_tool_parameters_introspected_once_up_front(self):
+        """Tool targets are checked against the preloaded tool parameters."""
+        from trident.dag import validate_edge_mappings
+        from trident.project import EdgeMapping, ToolDef
+
+        project = Project(name="test", root=Path("."))
+        project.input_nodes["input"] = InputNode(id="input")
+        project.tools["fetch"] = ToolDef(id="fetch", type="python", module="fetch")
+        project.edges["e1"] = Edge(
+            id="e1",
+            from_node="input",
+            to_node="fetch",
+            mappings=[EdgeMapping(source_expr="value", target_var="link")],
+        )
+        project.entrypoints = ["input"]
+        dag = build_dag(project)
+
+        with (
+            mock.patch("trident.dag.preload_tool_parameters", return_value={"fetch": {"url"}}),
+            mock.patch("trident.dag.get_tool_parameters") as get_tool_parameters,
+        ):
+            result = validate_edge_mappings(project, dag)
+
+        get_tool_parameters.assert_not_called()
+        self.assertEqual(len(result.warnings), 1)
+        self.assertIn("Expected inputs: ['url']", result.warnings[0].message)
+
 
 if __name__ == "__main__":
     unittest.main()
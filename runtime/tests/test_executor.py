@@ -1,14 +1,44 @@
 """Tests for DAG execution and error handling."""
 
+import json
+import os
+import tempfile
 import unittest
+from dataclasses import asdict
 from pathlib import Path
 
+import pytest
+
 from trident.errors import NodeExecutionError
 from trident.executor import ExecutionResult, ExecutionTrace, NodeTrace, run
 from trident.project import Edge, InputNode, OutputNode, Project
 
 
-class TestExecutionResult(unittest.TestCase):
+def _summary_result(kind: str) -> ExecutionResult:
+    """Build a two-node ExecutionResult that either succeeded or failed on node2."""
+    trace = ExecutionTrace(run_id="test", start_time="2024-01-01T00:00:00Z")
+    node1 = NodeTrace(
+        id="node1", start_time="2024-01-01T00:00:00Z", end_time="2024-01-01T00:00:01Z"
+    )
+    if kind == "success":
+        node2 = NodeTrace(
+            id="node2", start_time="2024-01-01T00:00:01Z", end_time="2024-01-01T00:00:02Z"
+        )
+        trace.nodes = [node1, node2]
+        return ExecutionResult(outputs={"test": "value"}, trace=trace)
+
+    node2 = NodeTrace(
+        id="node2",
+        start_time="2024-01-01T00:00:01Z",
+        error="Something broke",
+        error_type="ValueError",
+    )
+    trace.nodes = [node1, node2]
+    error = NodeExecutionError(node_id="node2", node_type="prompt", message="Something broke")
+    return ExecutionResult(outputs={}, trace=trace, error=error)
+
+
+class TestExecutionResult:
     """Tests for ExecutionResult structure."""
 
     def test_success_property(self):
@@ -17,75 +47,64 @@ class TestExecutionResult(unittest.TestCase):
 
         # Success case
         result = ExecutionResult(outputs={}, trace=trace, error=None)
-        self.assertTrue(result.success)
+        assert result.success
 
         # Failure case
         error = NodeExecutionError(node_id="test_node", node_type="prompt", message="Test error")
         result_with_error = ExecutionResult(outputs={}, trace=trace, error=error)
-        self.assertFalse(result_with_error.success)
-
-    def test_summary_on_success(self):
-        """ExecutionResult.summary() provides readable output on success."""
-        trace = ExecutionTrace(run_id="test", start_time="2024-01-01T00:00:00Z")
-        trace.nodes = [
-            NodeTrace(
-                id="node1", start_time="2024-01-01T00:00:00Z", end_time="2024-01-01T00:00:01Z"
-            ),
-            NodeTrace(
-                id="node2", start_time="2024-01-01T00:00:01Z", end_time="2024-01-01T00:00:02Z"
-            ),
-        ]
-
-        result = ExecutionResult(outputs={"test": "value"}, trace=trace)
-        summary = result.summary()
+        assert not result_with_error.success
 
-        self.assertIn("succeeded", summary)
-        self.assertIn("2 succeeded", summary)
-        self.assertIn("0 failed", summary)
+    @pytest.mark.parametrize(
+        ("kind", "expected"),
+        [
+            ("success", ["succeeded", "2 succeeded", "0 failed"]),
+            ("failure", ["FAILED", "node2", "Something broke"]),
+        ],
+    )
+    def test_summary(self, kind, expected):
+        """ExecutionResult.summary() reports success counts or the failing node."""
+        summary = _summary_result(kind).summary()
 
-    def test_summary_on_failure(self):
-        """ExecutionResult.summary() shows error details on failure."""
-        trace = ExecutionTrace(run_id="test", start_time="2024-01-01T00:00:00Z")
-        trace.nodes = [
-            NodeTrace(
-                id="node1", start_time="2024-01-01T00:00:00Z", end_time="2024-01-01T00:00:01Z"
-            ),
-            NodeTrace(
-                id="node2",
-                start_time="2024-01-01T00:00:01Z",
-                error="Something broke",
-                error_type="ValueError",
-            ),
-        ]
-
-        error = NodeExecutionError(node_id="node2", node_type="prompt", message="Something broke")
-        result = ExecutionResult(outputs={}, trace=trace, error=error)
-        summary = result.summary()
-
-        self.assertIn("FAILED", summary)
-        self.assertIn("node2", summary)
-        self.assertIn("Something broke", summary)
+        for text in expected:
+            assert text in summary
 
 
-class TestNodeTrace(unittest.TestCase):
+class TestNodeTrace:
     """Tests for NodeTrace structure."""
 
     def test_succeeded_property(self):
         """NodeTrace.succeeded reflects actual node state."""
         # Success
         node = NodeTrace(id="test", start_time="2024-01-01T00:00:00Z")
-        self.assertTrue(node.succeeded)
+        assert node.succeeded
 
         # Skipped
         skipped = NodeTrace(id="test", start_time="2024-01-01T00:00:00Z", skipped=True)
-        self.assertFalse(skipped.succeeded)
+        assert not skipped.succeeded
 
         # Error
         errored = NodeTrace(id="test", start_time="2024-01-01T00:00:00Z", error="Failed")
-        self.assertFalse(errored.succeeded)
+        assert not errored.succeeded
+
+    def test_to_dict_matches_fields(self):
+        """NodeTrace.to_dict covers every field; the summary drops payloads."""
+        node = NodeTrace(
+            id="test",
+            start_time="2024-01-01T00:00:00Z",
+            input={"q": 1},
+            output={"a": 2},
+            tokens={"input": 3, "output": 4},
+            num_turns=2,
+        )
+        assert node.to_dict() == asdict(node)
+        assert node.to_summary_dict() == {
+            k: v
+            for k, v in asdict(node).items()
+            if k not in ("input", "output", "cost_usd", "session_id", "num_turns")
+        }
 
 
-class TestExecutionTrace(unittest.TestCase):
+class TestExecutionTrace:
     """Tests for ExecutionTrace structure."""
 
     def test_failed_node_property(self):
@@ -98,9 +117,9 @@ class TestExecutionTrace(unittest.TestCase):
         ]
 
         failed = trace.failed_node
-        assert failed is not None  # Type narrowing for pyright
-        self.assertEqual(failed.id, "node2")
-        self.assertEqual(failed.error, "First error")
+        assert failed is not None
+        assert failed.id == "node2"
+        assert failed.error == "First error"
 
     def test_failed_node_none_on_success(self):
         """ExecutionTrace.failed_node returns None when all succeed."""
@@ -110,7 +129,7 @@ class TestExecutionTrace(unittest.TestCase):
             NodeTrace(id="node2", start_time="2024-01-01T00:00:01Z"),
         ]
 
-        self.assertIsNone(trace.failed_node)
+        assert trace.failed_node is None
 
 
 class TestNodeExecutionError(unittest.TestCase):
@@ -363,8 +382,6 @@ class TestJsonPromptOutput(unittest.TestCase):
         # Should have text field
         self.assertIn("text", output)
         # text should be valid JSON string
-        import json
-
         parsed = json.loads(output["text"])
         self.assertEqual(parsed["status"], "[mock_status]")
         self.assertEqual(parsed["count"], 0)
@@ -409,9 +426,6 @@ class TestStartFrom(unittest.TestCase):
 
     def test_start_from_invalid_node_raises(self):
         """start_from with invalid node raises TridentError."""
-        import json
-        import tempfile
-
         from trident.errors import TridentError
 
         project = Project(name="test", root=Path("."))
@@ -446,8 +460,6 @@ class TestStartFrom(unittest.TestCase):
 
             self.assertIn("Start-from node not found", str(ctx.exception))
         finally:
-            import os
-
             os.unlink(checkpoint_path)
 
 
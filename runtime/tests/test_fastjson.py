@@ -0,0 +1,71 @@
+"""Tests for the optional-orjson JSON helpers."""
+
+import json
+from dataclasses import dataclass, field
+
+import pytest
+
+from trident import fastjson
+
+
+@pytest.fixture(params=["default", "stdlib"])
+def backend(request, monkeypatch):
+    """Run a test with whichever backend is installed and with the stdlib fallback."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(fastjson, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize("indent", [False, True])
+def test_dumps_round_trips(backend, indent):
+    """Test output parses back to the same value with either backend."""
+    value = {"text": "héllo", "n": 3, "items": [1.5, None, True], "nested": {"a": []}}
+    encoded = fastjson.dumps(value, indent=indent)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == value
+
+
+def test_dumps_indent_matches_stdlib_layout(backend):
+    """Test indented output uses the same layout as json.dumps(indent=2)."""
+    value = {"a": [1, 2], "b": {"c": "d"}}
+    assert fastjson.dumps(value, indent=True).decode() == json.dumps(value, indent=2)
+
+
+def test_dumps_writes_non_ascii_as_utf8(backend):
+    """Test non-ASCII text is written as raw UTF-8, not \\u escapes, by either backend."""
+    value = {"text": "héllo ✓ 日本"}
+    assert fastjson.dumps(value) == '{"text":"héllo ✓ 日本"}'.encode()
+    assert fastjson.dumps(value, indent=True) == '{\n  "text": "héllo ✓ 日本"\n}'.encode()
+
+
+def test_dumps_falls_back_for_unsupported_values(backend):
+    """Test values orjson rejects are still encoded via the stdlib."""
+    assert fastjson.dumps({"big": 2**70}) == b'{"big":1180591620717411303424}'
+
+
+def test_loads_raises_json_decode_error(backend):
+    """Test invalid input raises json.JSONDecodeError with either backend."""
+    with pytest.raises(json.JSONDecodeError):
+        fastjson.loads("{not json")
+
+
+@dataclass(slots=True)
+class _Leaf:
+    name: str
+    when: object = None
+
+
+@dataclass
+class _Tree:
+    id: str
+    leaves: list[_Leaf] = field(default_factory=list)
+
+
+def test_dumps_dataclasses(backend):
+    """Test nested dataclasses encode field by field, using default for the rest."""
+    tree = _Tree(id="t", leaves=[_Leaf("a"), _Leaf("b", when=object)])
+    encoded = json.loads(fastjson.dumps(tree, indent=True, default=lambda v: "?"))
+    assert encoded == {
+        "id": "t",
+        "leaves": [{"name": "a", "when": None}, {"name": "b", "when": "?"}],
+    }
@@ -1,6 +1,7 @@
 """Tests for project loading."""
 
 import os
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
@@ -9,33 +10,28 @@ from trident.project import ParseError, ValidationError, _load_dotenv, load_proj
 
 
 class TestProjectLoading(unittest.TestCase):
-    def test_load_minimal_project(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-
-            # Create agent.tml
-            (root / "agent.tml").write_text("""
+    @classmethod
+    def setUpClass(cls):
+        cls._tmpdir = tempfile.mkdtemp()
+        base = Path(cls._tmpdir)
+
+        # Minimal project with a single prompt
+        root = cls.minimal_root = base / "minimal"
+        (root / "prompts").mkdir(parents=True)
+        (root / "agent.tml").write_text("""
 trident: "0.1"
 name: test-project
 """)
-
-            # Create prompts dir with a prompt
-            (root / "prompts").mkdir()
-            (root / "prompts" / "hello.prompt").write_text("""---
+        (root / "prompts" / "hello.prompt").write_text("""---
 id: hello
 ---
 Hello!
 """)
 
-            project = load_project(root)
-            self.assertEqual(project.name, "test-project")
-            self.assertIn("hello", project.prompts)
-
-    def test_load_with_edges(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-
-            (root / "agent.tml").write_text("""
+        # Project with an edge into a prompt
+        root = cls.edges_root = base / "edges"
+        (root / "prompts").mkdir(parents=True)
+        (root / "agent.tml").write_text("""
 trident: "0.1"
 name: test
 edges:
@@ -45,38 +41,16 @@ edges:
     mapping:
       data: text
 """)
-
-            (root / "prompts").mkdir()
-            (root / "prompts" / "process.prompt").write_text("""---
+        (root / "prompts" / "process.prompt").write_text("""---
 id: process
 ---
 Process {{data}}
 """)
 
-            project = load_project(root)
-            self.assertIn("e1", project.edges)
-            self.assertEqual(project.edges["e1"].from_node, "input")
-            self.assertEqual(project.edges["e1"].to_node, "process")
-
-    def test_missing_manifest_raises(self):
-        with tempfile.TemporaryDirectory() as tmpdir, self.assertRaises(ParseError):
-            load_project(tmpdir)
-
-    def test_missing_required_field_raises(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            (root / "agent.tml").write_text("""
-name: no-version
-""")
-            with self.assertRaises(ValidationError):
-                load_project(root)
-
-    def test_load_agent_node(self):
-        """Test loading a project with agent nodes (SPEC-3)."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-
-            (root / "agent.tml").write_text("""
+        # Project with an agent node (SPEC-3)
+        root = cls.agent_root = base / "agent"
+        (root / "prompts").mkdir(parents=True)
+        (root / "agent.tml").write_text("""
 trident: "0.2"
 name: test-agents
 nodes:
@@ -93,9 +67,7 @@ nodes:
           - "@playwright/mcp@latest"
     max_turns: 25
 """)
-
-            (root / "prompts").mkdir()
-            (root / "prompts" / "tester.prompt").write_text("""---
+        (root / "prompts" / "tester.prompt").write_text("""---
 id: tester
 output:
   format: json
@@ -108,19 +80,116 @@ output:
       description: Passed tests
 ---
 Test the app at {{app_url}}.
+""")
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._tmpdir, ignore_errors=True)
+
+    def test_load_minimal_project(self):
+        project = load_project(self.minimal_root)
+        self.assertEqual(project.name, "test-project")
+        self.assertIn("hello", project.prompts)
+
+    def test_load_with_edges(self):
+        project = load_project(self.edges_root)
+        self.assertIn("e1", project.edges)
+        self.assertEqual(project.edges["e1"].from_node, "input")
+        self.assertEqual(project.edges["e1"].to_node, "process")
+
+    def test_missing_manifest_raises(self):
+        with tempfile.TemporaryDirectory() as tmpdir, self.assertRaises(ParseError):
+            load_project(tmpdir)
+
+    def test_missing_required_field_raises(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "agent.tml").write_text("""
+name: no-version
+""")
+            with self.assertRaises(ValidationError):
+                load_project(root)
+
+    def test_load_agent_node(self):
+        """Test loading a project with agent nodes (SPEC-3)."""
+        project = load_project(self.agent_root)
+        self.assertEqual(project.name, "test-agents")
+        self.assertIn("tester", project.agents)
+
+        agent = project.agents["tester"]
+        self.assertEqual(agent.id, "tester")
+        self.assertEqual(agent.allowed_tools, ["Read", "Glob"])
+        self.assertEqual(agent.max_turns, 25)
+        self.assertIn("playwright", agent.mcp_servers)
+        self.assertEqual(agent.mcp_servers["playwright"].command, "npx")
+        self.assertEqual(agent.mcp_servers["playwright"].args, ["@playwright/mcp@latest"])
+
+    def test_load_orchestration_schedule(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "agent.tml").write_text("""
+trident: "0.1"
+name: scheduled
+orchestration:
+  schedule:
+    cron: "0 * * * *"
+  depends_on:
+    - workflow: upstream
+      signal: ready
+""")
+
+            orchestration = load_project(root).orchestration
+            self.assertEqual(orchestration.schedule, {"cron": "0 * * * *"})
+            self.assertEqual(
+                orchestration.depends_on, [{"workflow": "upstream", "signal": "ready"}]
+            )
+
+    def test_prompts_parsed_lazily(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+
+            (root / "agent.tml").write_text("""
+trident: "0.1"
+name: lazy
+""")
+
+            (root / "prompts").mkdir()
+            (root / "prompts" / "good.prompt").write_text("""---
+id: good
+---
+Fine
+""")
+            (root / "prompts" / "broken.prompt").write_text("no frontmatter")
+
+            # Loading indexes prompts without parsing them
+            project = load_project(root)
+            self.assertEqual(sorted(project.prompts), ["broken", "good"])
+            self.assertEqual(project.prompts["good"].body, "Fine")
+
+            with self.assertRaises(ParseError):
+                project.prompts["broken"]
+            with self.assertRaises(ParseError):
+                project.prompts.load_all()
+
+    def test_prompt_id_must_match_filename(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+
+            (root / "agent.tml").write_text("""
+trident: "0.1"
+name: mismatch
+""")
+
+            (root / "prompts").mkdir()
+            (root / "prompts" / "first.prompt").write_text("""---
+id: second
+---
+Hi
 """)
 
             project = load_project(root)
-            self.assertEqual(project.name, "test-agents")
-            self.assertIn("tester", project.agents)
-
-            agent = project.agents["tester"]
-            self.assertEqual(agent.id, "tester")
-            self.assertEqual(agent.allowed_tools, ["Read", "Glob"])
-            self.assertEqual(agent.max_turns, 25)
-            self.assertIn("playwright", agent.mcp_servers)
-            self.assertEqual(agent.mcp_servers["playwright"].command, "npx")
-            self.assertEqual(agent.mcp_servers["playwright"].args, ["@playwright/mcp@latest"])
+            with self.assertRaises(ParseError):
+                project.prompts["first"]
 
 
 class TestDotenvLoading(unittest.TestCase):
@@ -2,105 +2,125 @@
 
 import json
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
+import pytest
+
+from trident.parser import OutputSchema, PromptNode, parse_prompt_string
 from trident.providers.anthropic import AnthropicProvider
-from trident.providers.base import CompletionConfig, CompletionResult
+from trident.providers.base import CompletionConfig, CompletionResult, ProviderRegistry
+
+# One schema covering every field type, an unknown type and an empty description
+SCHEMA_TOOL_FIELDS = {
+    "status": ("string", "The status message"),
+    "score": ("number", "Quality score"),
+    "enabled": ("boolean", "A boolean"),
+    "items": ("array", "An array"),
+    "data": ("object", "An object"),
+    "mystery": ("unknown_type", "Some field"),
+    "blank": ("string", ""),
+}
+
+EXPECTED_SCHEMA_TOOL = {
+    "name": "structured_output",
+    "description": "Return structured output",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "status": {"type": "string", "description": "The status message"},
+            "score": {"type": "number", "description": "Quality score"},
+            "enabled": {"type": "boolean", "description": "A boolean"},
+            "items": {"type": "array", "description": "An array"},
+            "data": {"type": "object", "description": "An object"},
+            "mystery": {"type": "string", "description": "Some field"},
+            "blank": {"type": "string", "description": "The blank field"},
+        },
+        "required": ["status", "score", "enabled", "items", "data", "mystery", "blank"],
+    },
+}
 
 
 class TestAnthropicBuildSchemaTool(unittest.TestCase):
     """Tests for AnthropicProvider._build_schema_tool()."""
 
-    def setUp(self):
-        self.provider = AnthropicProvider()
+    @classmethod
+    def setUpClass(cls):
+        cls.provider = AnthropicProvider()
+        cls.schema_tool = cls.provider._build_schema_tool(SCHEMA_TOOL_FIELDS)
 
     def test_build_schema_tool_basic(self):
         """Test basic schema tool generation."""
-        schema = {
-            "status": ("string", "The status message"),
-            "score": ("number", "Quality score"),
-        }
-
-        tool = self.provider._build_schema_tool(schema)
-
-        self.assertEqual(tool["name"], "structured_output")
-        self.assertEqual(tool["description"], "Return structured output")
-        self.assertIn("input_schema", tool)
-
-        input_schema = tool["input_schema"]
-        self.assertEqual(input_schema["type"], "object")
-        self.assertIn("properties", input_schema)
-        self.assertIn("required", input_schema)
-
-        # Check properties
-        props = input_schema["properties"]
-        self.assertEqual(props["status"]["type"], "string")
-        self.assertEqual(props["status"]["description"], "The status message")
-        self.assertEqual(props["score"]["type"], "number")
-        self.assertEqual(props["score"]["description"], "Quality score")
-
-        # Check required
-        self.assertIn("status", input_schema["required"])
-        self.assertIn("score", input_schema["required"])
+        self.assertEqual(self.schema_tool, EXPECTED_SCHEMA_TOOL)
 
     def test_build_schema_tool_all_types(self):
         """Test schema tool handles all JSON types."""
-        schema = {
-            "text": ("string", "A string"),
-            "count": ("number", "A number"),
-            "enabled": ("boolean", "A boolean"),
-            "items": ("array", "An array"),
-            "data": ("object", "An object"),
-        }
-
-        tool = self.provider._build_schema_tool(schema)
-        props = tool["input_schema"]["properties"]
-
-        self.assertEqual(props["text"]["type"], "string")
-        self.assertEqual(props["count"]["type"], "number")
-        self.assertEqual(props["enabled"]["type"], "boolean")
-        self.assertEqual(props["items"]["type"], "array")
-        self.assertEqual(props["data"]["type"], "object")
+        properties = self.schema_tool["input_schema"]["properties"]
+        for field_name, json_type in (
+            ("status", "string"),
+            ("score", "number"),
+            ("enabled", "boolean"),
+            ("items", "array"),
+            ("data", "object"),
+        ):
+            with self.subTest(field_name=field_name):
+                self.assertEqual(properties[field_name]["type"], json_type)
 
     def test_build_schema_tool_unknown_type_defaults_to_string(self):
         """Test unknown types default to string."""
-        schema = {
-            "field": ("unknown_type", "Some field"),
-        }
-
-        tool = self.provider._build_schema_tool(schema)
-        props = tool["input_schema"]["properties"]
-
-        self.assertEqual(props["field"]["type"], "string")
+        self.assertEqual(
+            self.schema_tool["input_schema"]["properties"]["mystery"]["type"], "string"
+        )
 
     def test_build_schema_tool_empty_description(self):
         """Test empty descriptions get default."""
-        schema = {
-            "field": ("string", ""),
-        }
+        self.assertEqual(
+            self.schema_tool["input_schema"]["properties"]["blank"]["description"],
+            "The blank field",
+        )
 
-        tool = self.provider._build_schema_tool(schema)
-        props = tool["input_schema"]["properties"]
+    def test_build_schema_tool_returns_fresh_dict(self):
+        """Test mutating one tool definition does not leak into later ones."""
+        tool = self.provider._build_schema_tool(SCHEMA_TOOL_FIELDS)
+        tool["input_schema"]["properties"]["status"]["type"] = "number"
+        tool["input_schema"]["required"].clear()
+
+        self.assertEqual(
+            self.provider._build_schema_tool(dict(SCHEMA_TOOL_FIELDS)), EXPECTED_SCHEMA_TOOL
+        )
+
+
+class TestProviderRegistry(unittest.TestCase):
+    """Tests for ProviderRegistry."""
 
-        self.assertEqual(props["field"]["description"], "The field field")
+    def test_registry_builds_lazy_provider_once(self):
+        """Test lazily registered providers are built on first lookup only."""
+        registry = ProviderRegistry()
+        factory = MagicMock(return_value=AnthropicProvider())
+        registry.register_lazy("anthropic", factory)
+        factory.assert_not_called()
+
+        provider, model = registry.get_for_model("anthropic/claude-sonnet-4-20250514")
+        self.assertEqual((provider, model), (factory.return_value, "claude-sonnet-4-20250514"))
+        self.assertIs(registry.get("anthropic"), provider)
+        factory.assert_called_once_with()
+
+        # An explicit registration replaces a pending factory
+        registry.register_lazy("anthropic", factory)
+        custom = AnthropicProvider()
+        registry.register(custom)
+        self.assertIs(registry.get("anthropic"), custom)
+        factory.assert_called_once_with()
 
 
 class TestAnthropicProviderComplete(unittest.TestCase):
     """Tests for AnthropicProvider.complete() structured output handling."""
 
-    def setUp(self):
-        self.provider = AnthropicProvider()
+    @classmethod
+    def setUpClass(cls):
+        cls.provider = AnthropicProvider()
 
-    @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"})
-    @patch.object(AnthropicProvider, "_make_request")
-    def test_complete_json_format_uses_tool(self, mock_request):
+    def test_complete_json_format_uses_tool(self):
         """Test JSON format triggers tool_use with correct schema."""
-        mock_request.return_value = CompletionResult(
-            content='{"status": "ok", "score": 95}',
-            input_tokens=10,
-            output_tokens=20,
-        )
-
         config = CompletionConfig(
             model="claude-sonnet-4-20250514",
             output_format="json",
@@ -110,12 +130,7 @@ class TestAnthropicProviderComplete(unittest.TestCase):
             },
         )
 
-        self.provider.complete("Test prompt", config)
-
-        # Verify _make_request was called
-        mock_request.assert_called_once()
-        call_args = mock_request.call_args
-        body = call_args[0][0]
+        body = self.provider._build_request_body("Test prompt", config)
 
         # Verify tool was added
         self.assertIn("tools", body)
@@ -123,64 +138,53 @@ class TestAnthropicProviderComplete(unittest.TestCase):
         self.assertEqual(body["tools"][0]["name"], "structured_output")
 
         # Verify tool_choice was set
-        self.assertIn("tool_choice", body)
-        self.assertEqual(body["tool_choice"]["type"], "tool")
-        self.assertEqual(body["tool_choice"]["name"], "structured_output")
+        self.assertEqual(body["tool_choice"], {"type": "tool", "name": "structured_output"})
 
-    @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"})
-    @patch.object(AnthropicProvider, "_make_request")
-    def test_complete_text_format_no_tool(self, mock_request):
+    def test_complete_text_format_no_tool(self):
         """Test text format does NOT use tool."""
-        mock_request.return_value = CompletionResult(
-            content="Plain text response",
-            input_tokens=10,
-            output_tokens=20,
-        )
-
         config = CompletionConfig(
             model="claude-sonnet-4-20250514",
             output_format="text",
         )
 
-        self.provider.complete("Test prompt", config)
-
-        call_args = mock_request.call_args
-        body = call_args[0][0]
+        body = self.provider._build_request_body("Test prompt", config)
 
         # Verify no tool was added
         self.assertNotIn("tools", body)
         self.assertNotIn("tool_choice", body)
 
-    @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"})
-    @patch.object(AnthropicProvider, "_make_request")
-    def test_complete_json_without_schema_no_tool(self, mock_request):
+    def test_complete_json_without_schema_no_tool(self):
         """Test JSON format without schema does NOT use tool."""
-        mock_request.return_value = CompletionResult(
-            content='{"result": "data"}',
-            input_tokens=10,
-            output_tokens=20,
-        )
-
         config = CompletionConfig(
             model="claude-sonnet-4-20250514",
             output_format="json",
             output_schema=None,  # No schema
         )
 
-        self.provider.complete("Test prompt", config)
-
-        call_args = mock_request.call_args
-        body = call_args[0][0]
+        body = self.provider._build_request_body("Test prompt", config)
 
         # Verify no tool was added (schema is required for tool)
         self.assertNotIn("tools", body)
 
+    def test_complete_sends_body_through_transport(self):
+        """Test complete() hands the built body and API key to the transport."""
+        result = CompletionResult(content="ok", input_tokens=1, output_tokens=1)
+        transport = MagicMock(return_value=result)
+        provider = AnthropicProvider(api_key="test-key", transport=transport)
+        config = CompletionConfig(model="claude-sonnet-4-20250514", output_format="text")
+
+        self.assertIs(provider.complete("Test prompt", config), result)
+        transport.assert_called_once_with(
+            provider._build_request_body("Test prompt", config), "test-key", False
+        )
+
 
 class TestAnthropicResponseParsing(unittest.TestCase):
-    """Tests for parsing Anthropic API responses."""
+    """Tests for AnthropicProvider._parse_response()."""
 
-    def setUp(self):
-        self.provider = AnthropicProvider()
+    @classmethod
+    def setUpClass(cls):
+        cls.provider = AnthropicProvider()
 
     def test_parse_text_response(self):
         """Test parsing a text response."""
@@ -191,9 +195,9 @@ class TestAnthropicResponseParsing(unittest.TestCase):
 
         result = self.provider._parse_response(api_response, is_json=False)
 
-        self.assertEqual(result.content, "Hello, world!")
-        self.assertEqual(result.input_tokens, 10)
-        self.assertEqual(result.output_tokens, 5)
+        self.assertEqual(
+            result, CompletionResult(content="Hello, world!", input_tokens=10, output_tokens=5)
+        )
 
     def test_parse_tool_use_response(self):
         """Test parsing a tool_use response (structured output)."""
@@ -212,11 +216,8 @@ class TestAnthropicResponseParsing(unittest.TestCase):
         result = self.provider._parse_response(api_response, is_json=True)
 
         # Tool input should be JSON serialized
-        parsed = json.loads(result.content)
-        self.assertEqual(parsed["status"], "success")
-        self.assertEqual(parsed["score"], 95)
-        self.assertEqual(result.input_tokens, 15)
-        self.assertEqual(result.output_tokens, 10)
+        self.assertEqual(json.loads(result.content), {"status": "success", "score": 95})
+        self.assertEqual((result.input_tokens, result.output_tokens), (15, 10))
 
     def test_parse_empty_content(self):
         """Test parsing response with empty content."""
@@ -233,11 +234,10 @@ class TestAnthropicResponseParsing(unittest.TestCase):
 class TestSchemaFlowIntegration(unittest.TestCase):
     """Integration tests verifying schema flows from prompt to provider."""
 
+    pytestmark = pytest.mark.integration
+
     def test_prompt_schema_to_completion_config(self):
         """Test that prompt output schema is correctly passed to CompletionConfig."""
-        from trident.parser import OutputSchema, PromptNode
-        from trident.providers.base import CompletionConfig
-
         # Create a prompt node with JSON output schema
         prompt_node = PromptNode(
             id="test_prompt",
@@ -273,12 +273,7 @@ class TestSchemaFlowIntegration(unittest.TestCase):
         self.assertEqual(config.output_schema["confidence"], ("number", "Confidence score 0-100"))
 
     def test_parsed_prompt_file_schema(self):
-        """Test that parsing a .prompt file correctly extracts output schema."""
-        import tempfile
-        from pathlib import Path
-
-        from trident.parser import parse_prompt_file
-
+        """Test that parsing .prompt source correctly extracts output schema."""
         content = """---
 id: sentiment_analyzer
 name: Sentiment Analyzer
@@ -300,38 +295,23 @@ Analyze the sentiment of: {{text}}
 
 Return JSON with sentiment, confidence, and keywords.
 """
-        with tempfile.NamedTemporaryFile(suffix=".prompt", delete=False, mode="w") as f:
-            f.write(content)
-            f.flush()
-            path = Path(f.name)
+        node = parse_prompt_string(content)
 
-        try:
-            node = parse_prompt_file(path)
+        # Verify output format
+        self.assertEqual(node.output.format, "json")
 
-            # Verify output format
-            self.assertEqual(node.output.format, "json")
+        # Verify schema fields
+        self.assertIn("sentiment", node.output.fields)
+        self.assertIn("confidence", node.output.fields)
+        self.assertIn("keywords", node.output.fields)
 
-            # Verify schema fields
-            self.assertIn("sentiment", node.output.fields)
-            self.assertIn("confidence", node.output.fields)
-            self.assertIn("keywords", node.output.fields)
-
-            # Verify field types and descriptions
-            self.assertEqual(node.output.fields["sentiment"], ("string", "The detected sentiment"))
-            self.assertEqual(node.output.fields["confidence"], ("number", "Confidence score 0-100"))
-            self.assertEqual(node.output.fields["keywords"], ("array", "Key terms found"))
-        finally:
-            path.unlink()
+        # Verify field types and descriptions
+        self.assertEqual(node.output.fields["sentiment"], ("string", "The detected sentiment"))
+        self.assertEqual(node.output.fields["confidence"], ("number", "Confidence score 0-100"))
+        self.assertEqual(node.output.fields["keywords"], ("array", "Key terms found"))
 
     def test_end_to_end_schema_to_tool(self):
-        """Test complete flow: prompt file → parsed schema → tool definition."""
-        import tempfile
-        from pathlib import Path
-
-        from trident.parser import parse_prompt_file
-        from trident.providers.anthropic import AnthropicProvider
-        from trident.providers.base import CompletionConfig
-
+        """Test complete flow: prompt source → parsed schema → tool definition."""
         content = """---
 id: classifier
 output:
@@ -346,35 +326,27 @@ output:
 ---
 Classify: {{input}}
 """
-        with tempfile.NamedTemporaryFile(suffix=".prompt", delete=False, mode="w") as f:
-            f.write(content)
-            f.flush()
-            path = Path(f.name)
-
-        try:
-            # Step 1: Parse prompt
-            node = parse_prompt_file(path)
-
-            # Step 2: Build CompletionConfig (as executor does)
-            config = CompletionConfig(
-                model="test-model",
-                output_format=node.output.format,
-                output_schema=node.output.fields if node.output.format == "json" else None,
-            )
-
-            # Step 3: Build tool (as provider does)
-            provider = AnthropicProvider()
-            tool = provider._build_schema_tool(config.output_schema)
-
-            # Verify complete chain
-            self.assertEqual(tool["name"], "structured_output")
-            props = tool["input_schema"]["properties"]
-            self.assertEqual(props["category"]["type"], "string")
-            self.assertEqual(props["score"]["type"], "number")
-            self.assertIn("category", tool["input_schema"]["required"])
-            self.assertIn("score", tool["input_schema"]["required"])
-        finally:
-            path.unlink()
+        # Step 1: Parse prompt
+        node = parse_prompt_string(content)
+
+        # Step 2: Build CompletionConfig (as executor does)
+        config = CompletionConfig(
+            model="test-model",
+            output_format=node.output.format,
+            output_schema=node.output.fields if node.output.format == "json" else None,
+        )
+
+        # Step 3: Build tool (as provider does)
+        provider = AnthropicProvider()
+        tool = provider._build_schema_tool(config.output_schema)
+
+        # Verify complete chain
+        self.assertEqual(tool["name"], "structured_output")
+        props = tool["input_schema"]["properties"]
+        self.assertEqual(props["category"]["type"], "string")
+        self.assertEqual(props["score"]["type"], "number")
+        self.assertIn("category", tool["input_schema"]["required"])
+        self.assertIn("score", tool["input_schema"]["required"])
 
 
 if __name__ == "__main__":
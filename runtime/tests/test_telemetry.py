@@ -3,8 +3,8 @@
 import json
 import unittest
 from io import StringIO
-from pathlib import Path
-from tempfile import TemporaryDirectory
+
+import pytest
 
 from trident.telemetry import (
     EventType,
@@ -55,12 +55,17 @@ class TestTelemetryEvent(unittest.TestCase):
         )
 
         event_dict = event.to_dict()
-
-        self.assertEqual(event_dict["event"], "workflow_completed")
-        self.assertEqual(event_dict["run_id"], "test-run-123")
-        self.assertEqual(event_dict["level"], "INFO")
-        self.assertEqual(event_dict["data"]["duration_ms"], 1500)
-        self.assertIn("timestamp", event_dict)
+        self.assertIsNotNone(event_dict.pop("timestamp"))
+
+        self.assertEqual(
+            event_dict,
+            {
+                "run_id": "test-run-123",
+                "event": "workflow_completed",
+                "level": "INFO",
+                "data": {"duration_ms": 1500},
+            },
+        )
 
 
 class TestTelemetryConfig(unittest.TestCase):
@@ -88,138 +93,170 @@ class TestTelemetryConfig(unittest.TestCase):
         self.assertFalse(config.stdout)
 
 
-class TestTelemetryEmitter(unittest.TestCase):
-    """Tests for TelemetryEmitter."""
+@pytest.fixture
+def emitter_factory():
+    """Build an emitter writing to a fresh in-memory stream; returns (emitter, stream)."""
 
-    def test_emitter_disabled_by_default(self):
-        """TelemetryEmitter does nothing when disabled."""
+    def make(config: TelemetryConfig) -> tuple[TelemetryEmitter, StringIO]:
         output = StringIO()
-        config = TelemetryConfig(enabled=False)
+        return TelemetryEmitter(config, output_stream=output), output
 
-        with TelemetryEmitter(config, output_stream=output) as emitter:
-            emitter.emit(
-                EventType.WORKFLOW_STARTED,
-                run_id="test-run",
-                data={"name": "test"},
-            )
+    return make
 
-        # Should emit nothing when disabled
-        self.assertEqual(output.getvalue(), "")
 
-    def test_emitter_json_lines_format(self):
-        """TelemetryEmitter outputs JSON Lines format."""
-        output = StringIO()
-        config = TelemetryConfig(enabled=True, format="jsonl")
+def test_emitter_disabled_by_default():
+    """TelemetryEmitter does nothing when disabled."""
+    events: list[TelemetryEvent] = []
+    config = TelemetryConfig(enabled=False)
 
-        with TelemetryEmitter(config, output_stream=output) as emitter:
-            emitter.emit(
-                EventType.WORKFLOW_STARTED,
-                run_id="test-run-123",
-                data={"name": "my-workflow"},
-            )
+    with TelemetryEmitter(config, on_event=events.append) as emitter:
+        emitter.emit(
+            EventType.WORKFLOW_STARTED,
+            run_id="test-run",
+            data={"name": "test"},
+        )
 
-        lines = output.getvalue().strip().split("\n")
-        self.assertEqual(len(lines), 1)
+    # Should emit nothing when disabled
+    assert events == []
 
-        event_data = json.loads(lines[0])
-        self.assertEqual(event_data["event"], "workflow_started")
-        self.assertEqual(event_data["run_id"], "test-run-123")
-        self.assertEqual(event_data["data"]["name"], "my-workflow")
 
-    def test_emitter_multiple_events(self):
-        """TelemetryEmitter can emit multiple events."""
-        output = StringIO()
-        config = TelemetryConfig(enabled=True, format="jsonl")
-
-        with TelemetryEmitter(config, output_stream=output) as emitter:
-            emitter.emit(
-                EventType.WORKFLOW_STARTED,
-                run_id="test-run",
-                data={"name": "test"},
-            )
-            emitter.emit(
-                EventType.NODE_STARTED,
-                run_id="test-run",
-                node_id="input",
-                data={"type": "input"},
-            )
-            emitter.emit(
-                EventType.WORKFLOW_COMPLETED,
-                run_id="test-run",
-                data={"duration_ms": 1000},
-            )
-
-        lines = output.getvalue().strip().split("\n")
-        self.assertEqual(len(lines), 3)
-
-        # Verify each event
-        event1 = json.loads(lines[0])
-        self.assertEqual(event1["event"], "workflow_started")
-
-        event2 = json.loads(lines[1])
-        self.assertEqual(event2["event"], "node_started")
-        self.assertEqual(event2["node_id"], "input")
-
-        event3 = json.loads(lines[2])
-        self.assertEqual(event3["event"], "workflow_completed")
-
-    def test_emitter_writes_to_file(self):
-        """TelemetryEmitter can write to a file."""
-        with TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "telemetry.log"
-            config = TelemetryConfig(
-                enabled=True,
-                format="jsonl",
-                file_path=str(log_file),
-                stdout=False,
-            )
-
-            with TelemetryEmitter(config) as emitter:
-                emitter.emit(
-                    EventType.WORKFLOW_STARTED,
-                    run_id="test-run",
-                    data={"name": "test"},
-                )
-
-            # Verify file was created and contains the event
-            self.assertTrue(log_file.exists())
-            content = log_file.read_text()
-            event_data = json.loads(content.strip())
-            self.assertEqual(event_data["event"], "workflow_started")
-
-    def test_emitter_human_readable_format(self):
-        """TelemetryEmitter supports human-readable format."""
-        output = StringIO()
-        config = TelemetryConfig(enabled=True, format="human")
-
-        with TelemetryEmitter(config, output_stream=output) as emitter:
-            emitter.emit(
-                EventType.WORKFLOW_STARTED,
-                run_id="test-run-123",
-                data={"name": "my-workflow"},
-            )
-
-        output_text = output.getvalue()
-        self.assertIn("WORKFLOW_STARTED", output_text)
-        self.assertIn("test-run-123", output_text)
-        self.assertIn("my-workflow", output_text)
-
-    def test_emitter_context_manager_flushes(self):
-        """TelemetryEmitter flushes on context exit."""
-        output = StringIO()
-        config = TelemetryConfig(enabled=True, format="jsonl")
-
-        with TelemetryEmitter(config, output_stream=output) as emitter:
-            emitter.emit(
-                EventType.WORKFLOW_STARTED,
-                run_id="test-run",
-                data={"name": "test"},
-            )
-            # Before exit, output should already be available
-            # (we're not buffering in this simple implementation)
-
-        # After exit, ensure everything is flushed
-        self.assertGreater(len(output.getvalue()), 0)
+def test_emitter_json_lines_format(emitter_factory):
+    """TelemetryEmitter outputs JSON Lines format."""
+    emitter, output = emitter_factory(TelemetryConfig(enabled=True, format="jsonl"))
+
+    with emitter:
+        emitter.emit(
+            EventType.WORKFLOW_STARTED,
+            run_id="test-run-123",
+            data={"name": "my-workflow"},
+        )
+
+    event_data = json.loads(output.getvalue().rstrip())
+    assert event_data["event"] == "workflow_started"
+    assert event_data["run_id"] == "test-run-123"
+    assert event_data["data"] == {"name": "my-workflow"}
+
+
+def test_emitter_multiple_events():
+    """TelemetryEmitter can emit multiple events."""
+    events: list[TelemetryEvent] = []
+    config = TelemetryConfig(enabled=True, format="jsonl")
+
+    with TelemetryEmitter(config, on_event=events.append) as emitter:
+        emitter.emit(
+            EventType.WORKFLOW_STARTED,
+            run_id="test-run",
+            data={"name": "test"},
+        )
+        emitter.emit(
+            EventType.NODE_STARTED,
+            run_id="test-run",
+            node_id="input",
+            data={"type": "input"},
+        )
+        emitter.emit(
+            EventType.WORKFLOW_COMPLETED,
+            run_id="test-run",
+            data={"duration_ms": 1000},
+        )
+
+    assert [e.event_type for e in events] == [
+        EventType.WORKFLOW_STARTED,
+        EventType.NODE_STARTED,
+        EventType.WORKFLOW_COMPLETED,
+    ]
+    assert events[1].node_id == "input"
+
+
+def test_emitter_on_event_skips_stdout(capsys):
+    """An on_event sink replaces stdout output."""
+    events: list[TelemetryEvent] = []
+    config = TelemetryConfig(enabled=True, stdout=True)
+
+    with TelemetryEmitter(config, on_event=events.append) as emitter:
+        emitter.emit(EventType.WORKFLOW_STARTED, run_id="test-run")
+
+    assert len(events) == 1
+    assert capsys.readouterr().out == ""
+
+
+def test_emitter_writes_to_file(tmp_path):
+    """TelemetryEmitter can write to a file."""
+    log_file = tmp_path / "telemetry.log"
+    config = TelemetryConfig(
+        enabled=True,
+        format="jsonl",
+        file_path=str(log_file),
+        stdout=False,
+    )
+
+    with TelemetryEmitter(config) as emitter:
+        emitter.emit(
+            EventType.WORKFLOW_STARTED,
+            run_id="test-run",
+            data={"name": "test"},
+        )
+
+    # Verify the file contains the event
+    event_data = json.loads(log_file.read_text().strip())
+    assert event_data["event"] == "workflow_started"
+
+
+def test_emitter_flushes_file_on_workflow_end(tmp_path):
+    """TelemetryEmitter flushes buffered file output when the workflow ends."""
+    log_file = tmp_path / "telemetry.log"
+    config = TelemetryConfig(enabled=True, file_path=str(log_file), stdout=False)
+
+    with TelemetryEmitter(config) as emitter:
+        emitter.emit(EventType.WORKFLOW_STARTED, run_id="test-run")
+        emitter.emit(EventType.WORKFLOW_COMPLETED, run_id="test-run")
+
+        # Visible before the emitter is closed
+        assert len(log_file.read_text().splitlines()) == 2
+
+
+def test_emitter_flushes_file_on_node_started(tmp_path):
+    """A node_started event is visible in the log file while the node runs."""
+    log_file = tmp_path / "telemetry.log"
+    config = TelemetryConfig(enabled=True, file_path=str(log_file), stdout=False)
+
+    with TelemetryEmitter(config) as emitter:
+        emitter.emit(EventType.NODE_STARTED, run_id="test-run", node_id="agent")
+
+        event_data = json.loads(log_file.read_text())
+        assert (event_data["event"], event_data["node_id"]) == ("node_started", "agent")
+
+
+def test_emitter_human_readable_format(emitter_factory):
+    """TelemetryEmitter supports human-readable format."""
+    emitter, output = emitter_factory(TelemetryConfig(enabled=True, format="human"))
+
+    with emitter:
+        emitter.emit(
+            EventType.WORKFLOW_STARTED,
+            run_id="test-run-123",
+            data={"name": "my-workflow"},
+        )
+
+    output_text = output.getvalue()
+    assert "WORKFLOW_STARTED" in output_text
+    assert "test-run-123" in output_text
+    assert "my-workflow" in output_text
+
+
+def test_emitter_context_manager_flushes(emitter_factory):
+    """TelemetryEmitter flushes on context exit."""
+    emitter, output = emitter_factory(TelemetryConfig(enabled=True, format="jsonl"))
+
+    with emitter:
+        emitter.emit(
+            EventType.WORKFLOW_STARTED,
+            run_id="test-run",
+            data={"name": "test"},
+        )
+
+    # After exit, ensure everything is flushed
+    assert output.getvalue()
 
 
 class TestEventTypes(unittest.TestCase):
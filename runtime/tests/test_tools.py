@@ -1,28 +1,41 @@
 """Tests for tool introspection and execution."""
 
+import os
+import shutil
+import sys
 import tempfile
 import unittest
 from pathlib import Path
 
-from trident.project import ToolDef
-from trident.tools.python import get_tool_parameters
+from trident.project import Project, ToolDef
+from trident.tools.python import (
+    PythonToolRunner,
+    _module_name,
+    clear_tool_parameter_cache,
+    get_tool_parameters,
+    preload_tool_parameters,
+)
 
 
 class TestToolIntrospection(unittest.TestCase):
     """Tests for tool function introspection."""
 
-    def setUp(self):
-        """Create a temporary project with tool modules."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.project_root = Path(self.temp_dir)
-        self.tools_dir = self.project_root / "tools"
-        self.tools_dir.mkdir()
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary project shared by all tests (module names are unique)."""
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.project_root = Path(cls.temp_dir)
+        cls.tools_dir = cls.project_root / "tools"
+        cls.tools_dir.mkdir()
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up temporary directory."""
-        import shutil
+        shutil.rmtree(cls.temp_dir)
 
-        shutil.rmtree(self.temp_dir)
+    def setUp(self):
+        """Start each test without cached introspection results."""
+        clear_tool_parameter_cache()
 
     def _write_tool(self, filename: str, content: str) -> None:
         """Write a tool module to the temp tools directory."""
@@ -194,6 +207,158 @@ def get_timestamp() -> dict:
         params = get_tool_parameters(self.project_root, tool_def)
         self.assertEqual(params, set())
 
+    def test_introspect_keyword_only_and_positional_only(self):
+        """Includes positional-only and keyword-only parameters."""
+        self._write_tool(
+            "kinds.py",
+            """
+def execute(a, /, b, *rest, c, d=1, **extra):
+    local_var = a
+    return {}
+""",
+        )
+
+        tool_def = ToolDef(id="kinds", type="python", module="kinds")
+        params = get_tool_parameters(self.project_root, tool_def)
+        self.assertEqual(params, {"a", "b", "c", "d"})
+
+    def test_introspect_callable_object(self):
+        """Falls back to signature inspection for non-function callables."""
+        self._write_tool(
+            "callable_obj.py",
+            """
+class Tool:
+    def __call__(self, query, *, limit=5):
+        return {}
+
+execute = Tool()
+""",
+        )
+
+        tool_def = ToolDef(id="callable_obj", type="python", module="callable_obj")
+        params = get_tool_parameters(self.project_root, tool_def)
+        self.assertEqual(params, {"query", "limit"})
+
+    def test_introspect_decorated_functions(self):
+        """Introspects through functools.wraps decorators sharing one wrapper."""
+        self._write_tool(
+            "decorated.py",
+            """
+import functools
+
+def logged(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+    return wrapper
+
+@logged
+def first(a, b): ...
+
+@logged
+def second(c): ...
+""",
+        )
+
+        for function, expected in (("first", {"a", "b"}), ("second", {"c"})):
+            tool_def = ToolDef(id=function, type="python", module="decorated", function=function)
+            self.assertEqual(get_tool_parameters(self.project_root, tool_def), expected)
+
+    def test_tool_module_does_not_shadow_stdlib(self):
+        """A tool file named like a stdlib module is namespaced in sys.modules."""
+        self._write_tool("json.py", "def execute(payload): return {}\n")
+        tool_def = ToolDef(id="json_tool", type="python", module="json")
+        self.addCleanup(sys.modules.pop, _module_name("json.py"), None)
+        stdlib_json = sys.modules["json"]
+
+        self.assertEqual(get_tool_parameters(self.project_root, tool_def), {"payload"})
+        self.assertIs(sys.modules["json"], stdlib_json)
+
+    def test_preload_tool_parameters(self):
+        """Preloads every Python tool of a project, skipping other tool types."""
+        self._write_tool("preload_a.py", "def execute(x): ...\n")
+        self._write_tool("preload_b.py", "def run(y, z): ...\ndef other(w): ...\n")
+        project = Project(
+            name="preload",
+            root=self.project_root,
+            tools={
+                "a": ToolDef(id="a", type="python", module="preload_a"),
+                "b": ToolDef(id="b", type="python", module="preload_b", function="run"),
+                "b2": ToolDef(id="b2", type="python", module="preload_b", function="other"),
+                "missing": ToolDef(id="missing", type="python", module="preload_missing"),
+                "sh": ToolDef(id="sh", type="shell", path="script.sh"),
+            },
+        )
+
+        self.assertEqual(
+            preload_tool_parameters(project),
+            {"a": {"x"}, "b": {"y", "z"}, "b2": {"w"}, "missing": None},
+        )
+
+    def test_introspect_cache_invalidated_on_edit(self):
+        """Re-introspects a module after it changes on disk."""
+        path = self.tools_dir / "edited.py"
+        self._write_tool("edited.py", "def execute(a): pass\n")
+        tool_def = ToolDef(id="edited", type="python", module="edited")
+
+        self.assertEqual(get_tool_parameters(self.project_root, tool_def), {"a"})
+
+        # Cached result is a fresh set each call
+        get_tool_parameters(self.project_root, tool_def).add("mutated")
+        self.assertEqual(get_tool_parameters(self.project_root, tool_def), {"a"})
+
+        stat = path.stat()
+        self._write_tool("edited.py", "def execute(a, b): pass\n")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertEqual(get_tool_parameters(self.project_root, tool_def), {"a", "b"})
+
+    def test_tool_modules_with_similar_paths_stay_separate(self):
+        """Paths that sanitize to the same name still load their own modules."""
+        (self.tools_dir / "nested").mkdir()
+        self._write_tool("nested/mod.py", "def execute(x): return {'from': 'nested'}\n")
+        self._write_tool("nested_mod.py", "def execute(y): return {'from': 'flat'}\n")
+        for name in ("nested/mod.py", "nested_mod.py"):
+            self.addCleanup(sys.modules.pop, _module_name(name), None)
+
+        runner = PythonToolRunner(self.project_root)
+        nested = ToolDef(id="nested", type="python", module="nested/mod")
+        flat = ToolDef(id="flat", type="python", module="nested_mod")
+
+        self.assertEqual(get_tool_parameters(self.project_root, nested), {"x"})
+        self.assertEqual(get_tool_parameters(self.project_root, flat), {"y"})
+        self.assertEqual(runner.execute(nested, {"x": 1}), {"from": "nested"})
+        self.assertEqual(runner.execute(flat, {"y": 1}), {"from": "flat"})
+        self.assertEqual(
+            sys.modules[_module_name("nested/mod.py")].__file__,
+            str(self.tools_dir / "nested/mod.py"),
+        )
+
+    def test_runner_reuses_introspected_module(self):
+        """The runner picks up the module introspection already imported."""
+        self._write_tool("shared_mod.py", "def execute(x): return {'y': x}\n")
+        tool_def = ToolDef(id="shared_mod", type="python", module="shared_mod")
+        self.addCleanup(sys.modules.pop, _module_name("shared_mod.py"), None)
+
+        get_tool_parameters(self.project_root, tool_def)
+        module = PythonToolRunner(self.project_root)._load_module("shared_mod")
+        self.assertIs(module, sys.modules[_module_name("shared_mod.py")])
+        self.assertNotIn("shared_mod", sys.modules)
+        self.assertEqual(module.execute(1), {"y": 1})
+
+    def test_runner_reloads_edited_module(self):
+        """A module edited after it was imported is loaded again, not reused."""
+        path = self.tools_dir / "reloaded.py"
+        self._write_tool("reloaded.py", "def execute(x): return {'v': 1}\n")
+        tool_def = ToolDef(id="reloaded", type="python", module="reloaded")
+        self.addCleanup(sys.modules.pop, _module_name("reloaded.py"), None)
+
+        self.assertEqual(PythonToolRunner(self.project_root).execute(tool_def, {"x": 0}), {"v": 1})
+
+        stat = path.stat()
+        self._write_tool("reloaded.py", "def execute(x): return {'v': 2}\n")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertEqual(PythonToolRunner(self.project_root).execute(tool_def, {"x": 0}), {"v": 2})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,43 +1,81 @@
 """Trident - Lightweight agent orchestration runtime."""
 
-from .artifacts import (
-    ArtifactConfig,
-    ArtifactManager,
-    BranchIterationState,
-    RunEntry,
-    RunManifest,
-    RunMetadata,
-    find_latest_run,
-    get_artifact_manager,
-)
-from .dag import (
-    ValidationResult,
-    ValidationWarning,
-    validate_edge_mappings,
-)
-from .errors import (
-    ConditionError,
-    DAGError,
-    ExitCode,
-    NodeExecutionError,
-    ParseError,
-    ProviderError,
-    SchemaValidationError,
-    ToolError,
-    TridentError,
-    ValidationError,
-)
-from .executor import (
-    Checkpoint,
-    CheckpointNodeData,
-    ExecutionResult,
-    ExecutionTrace,
-    NodeTrace,
-    run,
-)
-from .project import Project, load_project
+import importlib
+from typing import TYPE_CHECKING
 
-__version__ = "0.10.0"
+from ._version import __version__ as __version__
+
+if TYPE_CHECKING:
+    from .artifacts import (
+        ArtifactConfig,
+        ArtifactManager,
+        BranchIterationState,
+        RunEntry,
+        RunManifest,
+        RunMetadata,
+        find_latest_run,
+        get_artifact_manager,
+    )
+    from .dag import (
+        ValidationResult,
+        ValidationWarning,
+        validate_edge_mappings,
+    )
+    from .errors import (
+        ConditionError,
+        DAGError,
+        ExitCode,
+        NodeExecutionError,
+        ParseError,
+        ProviderError,
+        SchemaValidationError,
+        ToolError,
+        TridentError,
+        ValidationError,
+    )
+    from .executor import (
+        Checkpoint,
+        CheckpointNodeData,
+        ExecutionResult,
+        ExecutionTrace,
+        NodeTrace,
+        run,
+    )
+    from .project import Project, load_project
+
+# Public name -> submodule it lives in. Submodules are imported on first
+# attribute access (PEP 562) so `import trident` stays cheap.
+_LAZY: dict[str, str] = {
+    "ArtifactConfig": ".artifacts",
+    "ArtifactManager": ".artifacts",
+    "BranchIterationState": ".artifacts",
+    "RunEntry": ".artifacts",
+    "RunManifest": ".artifacts",
+    "RunMetadata": ".artifacts",
+    "find_latest_run": ".artifacts",
+    "get_artifact_manager": ".artifacts",
+    "ValidationResult": ".dag",
+    "ValidationWarning": ".dag",
+    "validate_edge_mappings": ".dag",
+    "ConditionError": ".errors",
+    "DAGError": ".errors",
+    "ExitCode": ".errors",
+    "NodeExecutionError": ".errors",
+    "ParseError": ".errors",
+    "ProviderError": ".errors",
+    "SchemaValidationError": ".errors",
+    "ToolError": ".errors",
+    "TridentError": ".errors",
+    "ValidationError": ".errors",
+    "Checkpoint": ".executor",
+    "CheckpointNodeData": ".executor",
+    "ExecutionResult": ".executor",
+    "ExecutionTrace": ".executor",
+    "NodeTrace": ".executor",
+    "run": ".executor",
+    "Project": ".project",
+    "load_project": ".project",
+}
 
 __all__ = [
     # Project loading
@@ -75,3 +113,16 @@ __all__ = [
     "NodeExecutionError",
     "ExitCode",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
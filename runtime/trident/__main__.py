@@ -1,46 +1,48 @@
 """CLI entry point for Trident."""
 
-import argparse
-import json
+import functools
+import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from . import (
-    ExitCode,
-    RunManifest,
-    TridentError,
-    __version__,
-    find_latest_run,
-    load_project,
-    run,
-)
-from .artifacts import resolve_input_source
-from .orchestration import SignalTimeoutError, wait_for_signal_files
+from ._version import __version__
 
+if TYPE_CHECKING:
+    import argparse
 
-def main() -> int:
-    parser = argparse.ArgumentParser(
-        prog="trident",
-        description="Trident - Lightweight agent orchestration runtime",
-    )
-    parser.add_argument("--version", action="version", version=f"trident {__version__}")
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
+# Everything else in the package (errors, project loading, executor,
+# artifacts) is imported inside the commands that need it so `--version`,
+# `--help` and argument errors start fast. argparse itself is imported by
+# _build_parser, so `trident version` never loads it.
 
-    # Version command
-    subparsers.add_parser("version", help="Show version")
+# Static part of the mermaid.live editor state; only "code" varies
+_MERMAID_STATE = {"mermaid": {"theme": "default"}, "autoSync": True, "updateDiagram": True}
 
-    # Project command with subcommands
-    project_parser = subparsers.add_parser("project", help="Project commands")
-    project_subparsers = project_parser.add_subparsers(
-        dest="subcommand", help="Project subcommands"
-    )
+# Icons shown by `trident project runs`, keyed by run status
+_STATUS_ICONS = {"completed": "✓", "failed": "✗", "running": "…", "interrupted": "⊘"}
 
-    # project init
-    init_parser = project_subparsers.add_parser("init", help="Create a new Trident project")
-    init_parser.add_argument(
-        "path", nargs="?", default=".", help="Path to create project (default: .)"
-    )
-    init_parser.add_argument(
+
+def _trace_line(node) -> str:
+    """One `[STATUS] id (in+out tokens) - error` line of the pretty trace."""
+    error = node.error
+    tokens = node.tokens
+    if error:
+        status = "FAILED"
+    else:
+        status = "SKIPPED" if node.skipped else "OK"
+    line = f"  [{status}] {node.id}"
+    if tokens:
+        line += f" ({tokens.get('input', 0)}+{tokens.get('output', 0)} tokens)"
+    if error:
+        line += f" - {error}"
+    return line
+
+
+def _add_init_args(parser: "argparse.ArgumentParser") -> None:
+    """Arguments for `trident project init`."""
+    parser.add_argument("path", nargs="?", default=".", help="Path to create project (default: .)")
+    parser.add_argument(
         "--template",
         "-t",
         choices=["minimal", "standard"],
@@ -48,182 +50,253 @@ def main() -> int:
         help="Project template (default: minimal)",
     )
 
-    # project run
-    run_parser = project_subparsers.add_parser("run", help="Execute a Trident pipeline")
-    run_parser.add_argument("path", nargs="?", default=".", help="Path to project (default: .)")
-    run_parser.add_argument("--input", "-i", help="JSON input data")
-    run_parser.add_argument("--input-file", "-f", help="Path to JSON input file")
-    run_parser.add_argument("--entrypoint", "-e", help="Starting node ID")
-    run_parser.add_argument(
+
+def _add_run_args(parser: "argparse.ArgumentParser") -> None:
+    """Arguments for `trident project run`."""
+    import argparse
+
+    parser.add_argument("path", nargs="?", default=".", help="Path to project (default: .)")
+    parser.add_argument("--input", "-i", help="JSON input data")
+    parser.add_argument("--input-file", "-f", help="Path to JSON input file")
+    parser.add_argument("--entrypoint", "-e", help="Starting node ID")
+    parser.add_argument(
         "--output",
         "-o",
         choices=["json", "text", "pretty"],
         default="pretty",
         help="Output format (default: pretty)",
     )
-    run_parser.add_argument("--trace", action="store_true", help="Output execution trace")
-    run_parser.add_argument("--dry-run", action="store_true", help="Simulate without LLM calls")
-    run_parser.add_argument(
-        "--verbose", "-v", action="store_true", help="Show node execution progress"
-    )
+    parser.add_argument("--trace", action="store_true", help="Output execution trace")
+    parser.add_argument("--dry-run", action="store_true", help="Simulate without LLM calls")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Show node execution progress")
     # Artifact options
-    run_parser.add_argument(
+    parser.add_argument(
         "--no-artifacts",
         action="store_true",
         help="Disable artifact persistence (default: artifacts saved to .trident/)",
     )
-    run_parser.add_argument(
+    parser.add_argument(
         "--artifact-dir",
         help="Custom directory for artifacts (default: .trident/)",
     )
-    run_parser.add_argument(
+    parser.add_argument(
         "--run-id",
         help="Custom run ID (default: auto-generated UUID)",
     )
-    run_parser.add_argument(
+    parser.add_argument(
         "--resume",
         help='Resume from a previous run. Use run ID or "latest"',
     )
-    run_parser.add_argument(
+    parser.add_argument(
         "--start-from",
         dest="start_from",
         help="Start execution from a specific node (requires --resume). "
         "Nodes before this point use cached outputs from the resumed run.",
     )
     # Orchestration options
-    run_parser.add_argument(
+    parser.add_argument(
         "--input-from",
         dest="input_from",
         help="Load inputs from file path, alias:name, or run:id",
     )
-    run_parser.add_argument(
+    parser.add_argument(
         "--emit-signal",
         dest="emit_signal",
         action="store_true",
         help="Emit orchestration signals (started/completed/failed/ready)",
     )
-    run_parser.add_argument(
+    parser.add_argument(
         "--publish-to",
         dest="publish_to",
         help="Path to publish outputs (overrides manifest orchestration.publish.path)",
     )
-    run_parser.add_argument(
+    parser.add_argument(
         "--wait-for",
         dest="wait_for",
         action="append",
         help="Wait for signal file(s) before starting. Can be specified multiple times. "
         "Supports: signal:name.type, relative paths, or absolute paths.",
     )
-    run_parser.add_argument(
+    parser.add_argument(
         "--timeout",
         type=float,
         default=300.0,
         help="Timeout in seconds for --wait-for (default: 300)",
     )
     # Telemetry options
-    run_parser.add_argument(
+    parser.add_argument(
         "--telemetry",
         action=argparse.BooleanOptionalAction,
         default=True,
         help="Enable real-time telemetry output (default: enabled, use --no-telemetry to disable)",
     )
-    run_parser.add_argument(
+    parser.add_argument(
         "--telemetry-format",
         choices=["jsonl", "human"],
         default="human",
         help="Telemetry output format: jsonl (JSON Lines) or human (default: human)",
     )
-    run_parser.add_argument(
+    parser.add_argument(
         "--telemetry-file",
         dest="telemetry_file",
         help="Write telemetry to file (in addition to or instead of stdout)",
     )
-    run_parser.add_argument(
+    parser.add_argument(
         "--telemetry-stdout",
         dest="telemetry_stdout",
         action="store_true",
         help="Write telemetry to stdout (default: true unless --telemetry-file is specified alone)",
     )
-    run_parser.add_argument(
+    parser.add_argument(
         "--telemetry-level",
         choices=["debug", "info", "warning", "error"],
         default="info",
         help="Minimum telemetry event level (default: info)",
     )
 
-    # project validate
-    validate_parser = project_subparsers.add_parser("validate", help="Validate a Trident project")
-    validate_parser.add_argument(
-        "path", nargs="?", default=".", help="Path to project (default: .)"
-    )
-    validate_parser.add_argument(
+
+def _add_validate_args(parser: "argparse.ArgumentParser") -> None:
+    """Arguments for `trident project validate`."""
+    parser.add_argument("path", nargs="?", default=".", help="Path to project (default: .)")
+    parser.add_argument(
         "--strict",
         action="store_true",
         help="Treat warnings as errors (e.g., edge mapping mismatches)",
     )
 
-    # project graph
-    graph_parser = project_subparsers.add_parser("graph", help="Visualize the project DAG")
-    graph_parser.add_argument("path", nargs="?", default=".", help="Path to project (default: .)")
-    graph_parser.add_argument(
+
+def _add_graph_args(parser: "argparse.ArgumentParser") -> None:
+    """Arguments for `trident project graph`."""
+    parser.add_argument("path", nargs="?", default=".", help="Path to project (default: .)")
+    parser.add_argument(
         "--format",
         "-f",
         choices=["ascii", "mermaid"],
         default="ascii",
         help="Output format (default: ascii)",
     )
-    graph_parser.add_argument(
+    parser.add_argument(
         "--direction",
         "-d",
         choices=["TD", "LR", "BT", "RL"],
         default="TD",
         help="Mermaid flow direction: TD (top-down), LR (left-right), etc.",
     )
-    graph_parser.add_argument(
+    parser.add_argument(
         "--open",
         action="store_true",
         help="Open Mermaid diagram in browser (mermaid.live)",
     )
 
-    # project runs
-    runs_parser = project_subparsers.add_parser("runs", help="List past runs")
-    runs_parser.add_argument("path", nargs="?", default=".", help="Path to project (default: .)")
-    runs_parser.add_argument(
+
+def _add_runs_args(parser: "argparse.ArgumentParser") -> None:
+    """Arguments for `trident project runs`."""
+    parser.add_argument("path", nargs="?", default=".", help="Path to project (default: .)")
+    parser.add_argument(
         "--limit", "-n", type=int, default=10, help="Number of runs to show (default: 10)"
     )
 
-    # project schedule
-    schedule_parser = project_subparsers.add_parser(
-        "schedule", help="Generate scheduler configuration for workflow"
-    )
-    schedule_parser.add_argument(
-        "path", nargs="?", default=".", help="Path to project (default: .)"
-    )
-    schedule_parser.add_argument(
+
+def _add_schedule_args(parser: "argparse.ArgumentParser") -> None:
+    """Arguments for `trident project schedule`."""
+    parser.add_argument("path", nargs="?", default=".", help="Path to project (default: .)")
+    parser.add_argument(
         "--format",
         "-f",
         choices=["cron", "systemd", "launchd"],
         default="cron",
         help="Output format (default: cron)",
     )
-    schedule_parser.add_argument(
+    parser.add_argument(
         "--show",
         action="store_true",
         help="Show current schedule configuration from manifest",
     )
 
-    # project signals
-    signals_parser = project_subparsers.add_parser(
-        "signals", help="View and manage orchestration signals"
-    )
-    signals_parser.add_argument("path", nargs="?", default=".", help="Path to project (default: .)")
-    signals_parser.add_argument(
+
+def _add_signals_args(parser: "argparse.ArgumentParser") -> None:
+    """Arguments for `trident project signals`."""
+    parser.add_argument("path", nargs="?", default=".", help="Path to project (default: .)")
+    parser.add_argument(
         "--clear",
         action="store_true",
         help="Remove all signal files",
     )
 
-    args = parser.parse_args()
+
+# Project subcommand -> (help text, function adding its arguments)
+_PROJECT_SUBCOMMANDS = {
+    "init": ("Create a new Trident project", _add_init_args),
+    "run": ("Execute a Trident pipeline", _add_run_args),
+    "validate": ("Validate a Trident project", _add_validate_args),
+    "graph": ("Visualize the project DAG", _add_graph_args),
+    "runs": ("List past runs", _add_runs_args),
+    "schedule": ("Generate scheduler configuration for workflow", _add_schedule_args),
+    "signals": ("View and manage orchestration signals", _add_signals_args),
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the project subcommand named in argv, if it is unambiguous."""
+    if len(argv) >= 2 and argv[0] == "project" and argv[1] in _PROJECT_SUBCOMMANDS:
+        return argv[1]
+    return None
+
+
+@functools.cache
+def _build_parser(
+    subcommand: str | None = None,
+) -> tuple["argparse.ArgumentParser", "argparse.ArgumentParser"]:
+    """Build the CLI parser; returns (parser, project_parser).
+
+    If subcommand is given only that project subparser is added, which is
+    all argparse needs to parse a command line naming it. Otherwise every
+    subcommand is added so help and "invalid choice" errors list them all.
+    Parsers are cached per process: parse_args() returns a fresh Namespace
+    each call, so they can be reused across in-process calls to main().
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="trident",
+        description="Trident - Lightweight agent orchestration runtime",
+    )
+    # Handled in main() like the `version` command, before anything is imported
+    parser.add_argument(
+        "--version", action="store_true", help="show program's version number and exit"
+    )
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+
+    # Version command
+    subparsers.add_parser("version", help="Show version")
+
+    # Project command with subcommands
+    project_parser = subparsers.add_parser("project", help="Project commands")
+    project_subparsers = project_parser.add_subparsers(
+        dest="subcommand", help="Project subcommands"
+    )
+
+    names = [subcommand] if subcommand else list(_PROJECT_SUBCOMMANDS)
+    for name in names:
+        help_text, add_args = _PROJECT_SUBCOMMANDS[name]
+        add_args(project_subparsers.add_parser(name, help=help_text))
+
+    return parser, project_parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Answer version probes without building the parser
+    if argv in (["--version"], ["version"]):
+        return cmd_version()
+
+    parser, project_parser = _build_parser(_sniff_subcommand(argv))
+    args = parser.parse_args(argv)
+
+    if args.version:
+        return cmd_version()
 
     if not args.command:
         parser.print_help()
@@ -236,24 +309,14 @@ def main() -> int:
             if not args.subcommand:
                 project_parser.print_help()
                 return 0
-            if args.subcommand == "init":
-                return cmd_project_init(args)
-            elif args.subcommand == "run":
-                return cmd_project_run(args)
-            elif args.subcommand == "validate":
-                return cmd_project_validate(args)
-            elif args.subcommand == "graph":
-                return cmd_project_graph(args)
-            elif args.subcommand == "runs":
-                return cmd_project_runs(args)
-            elif args.subcommand == "schedule":
-                return cmd_project_schedule(args)
-            elif args.subcommand == "signals":
-                return cmd_project_signals(args)
-    except TridentError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return e.exit_code
+            return _PROJECT_HANDLERS[args.subcommand](args)
     except Exception as e:
+        # Only failing commands pay for importing the error types
+        from .errors import ExitCode, TridentError
+
+        if isinstance(e, TridentError):
+            print(f"Error: {e}", file=sys.stderr)
+            return e.exit_code
         print(f"Unexpected error: {e}", file=sys.stderr)
         return ExitCode.RUNTIME_ERROR
 
@@ -266,26 +329,9 @@ def cmd_version() -> int:
     return 0
 
 
-def cmd_project_init(args) -> int:
-    """Create a new project."""
-    path = Path(args.path).resolve()
-
-    # Create directory if it doesn't exist
-    path.mkdir(parents=True, exist_ok=True)
-
-    # Check if already a trident project (any manifest format)
-    for existing in ["agent.tml", "trident.tml", "trident.yaml"]:
-        if (path / existing).exists():
-            print(f"Error: {path} already contains {existing}", file=sys.stderr)
-            return ExitCode.VALIDATION_ERROR
-    manifest_path = path / "agent.tml"
-
-    # Determine project name from directory
-    project_name = path.name if path.name != "." else Path.cwd().name
-
-    # Create manifest
-    manifest_content = f"""trident: "0.1"
-name: {project_name}
+# Files written by `trident project init` (the static ones as bytes, written as-is)
+_MANIFEST_TEMPLATE = """trident: "0.1"
+name: {name}
 description: A Trident project
 
 defaults:
@@ -321,14 +367,8 @@ edges:
     mapping:
       result: output
 """
-    manifest_path.write_text(manifest_content)
 
-    # Create prompts directory
-    prompts_dir = path / "prompts"
-    prompts_dir.mkdir(exist_ok=True)
-
-    # Create example prompt
-    example_prompt = """---
+_EXAMPLE_PROMPT = b"""---
 id: example
 name: Example Prompt
 description: An example prompt that echoes input
@@ -356,15 +396,8 @@ Respond with a JSON object containing:
 - result: A brief summary or echo of the input
 - length: The character count of the input
 """
-    (prompts_dir / "example.prompt").write_text(example_prompt)
 
-    # Create additional files for standard template
-    if args.template == "standard":
-        (path / "tools").mkdir(exist_ok=True)
-        (path / "schemas").mkdir(exist_ok=True)
-
-        # Create example tool
-        tool_content = '''"""Example tool for Trident."""
+_EXAMPLE_TOOL = b'''"""Example tool for Trident."""
 
 
 def process(text: str) -> dict:
@@ -374,20 +407,68 @@ def process(text: str) -> dict:
         "char_count": len(text),
     }
 '''
-        (path / "tools" / "example_tool.py").write_text(tool_content)
 
-    print(f"Created Trident project at {path}")
-    print(f"  Template: {args.template}")
-    print("  Manifest: agent.tml")
-    print("  Prompts:  prompts/example.prompt")
+
+def cmd_project_init(args) -> int:
+    """Create a new project."""
+    # Lexical normalization only: the directory usually doesn't exist yet, so
+    # resolve()'s per-component lstat calls would be wasted
+    path = Path(os.path.abspath(args.path))
+
+    # Create directory if it doesn't exist
+    path.mkdir(parents=True, exist_ok=True)
+
+    # Check if already a trident project (any manifest format), using one
+    # directory listing rather than a stat per candidate name
+    with os.scandir(path) as entries:
+        existing_names = {entry.name for entry in entries}
+    existing = next(
+        (n for n in ("agent.tml", "trident.tml", "trident.yaml") if n in existing_names), None
+    )
+    if existing:
+        from .errors import ExitCode
+
+        print(f"Error: {path} already contains {existing}", file=sys.stderr)
+        return ExitCode.VALIDATION_ERROR
+    manifest_path = path / "agent.tml"
+
+    # Determine project name from directory
+    project_name = path.name if path.name != "." else Path.cwd().name
+
+    # Create manifest
+    manifest_path.write_bytes(_MANIFEST_TEMPLATE.format(name=project_name).encode("utf-8"))
+
+    # Create prompts directory
+    prompts_dir = path / "prompts"
+    prompts_dir.mkdir(exist_ok=True)
+
+    # Create example prompt
+    (prompts_dir / "example.prompt").write_bytes(_EXAMPLE_PROMPT)
+
+    # Create additional files for standard template
     if args.template == "standard":
-        print("  Tools:    tools/")
-        print("  Schemas:  schemas/")
-    print()
-    print("Next steps:")
-    print(f"  cd {path}")
-    print("  trident project validate")
-    print("  trident project run --dry-run")
+        (path / "tools").mkdir(exist_ok=True)
+        (path / "schemas").mkdir(exist_ok=True)
+
+        # Create example tool
+        (path / "tools" / "example_tool.py").write_bytes(_EXAMPLE_TOOL)
+
+    lines = [
+        f"Created Trident project at {path}",
+        f"  Template: {args.template}",
+        "  Manifest: agent.tml",
+        "  Prompts:  prompts/example.prompt",
+    ]
+    if args.template == "standard":
+        lines += ["  Tools:    tools/", "  Schemas:  schemas/"]
+    lines += [
+        "",
+        "Next steps:",
+        f"  cd {path}",
+        "  trident project validate",
+        "  trident project run --dry-run",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return 0
 
@@ -395,8 +476,11 @@ def process(text: str) -> dict:
 def cmd_project_validate(args) -> int:
     """Validate a project."""
     from .dag import build_dag, validate_edge_mappings, validate_subworkflows
+    from .errors import ExitCode
+    from .project import load_project
 
     project = load_project(args.path)
+    project.prompts.load_all()
     dag = build_dag(project)
 
     # Validate edge mappings
@@ -444,11 +528,8 @@ def cmd_project_validate(args) -> int:
 
 def cmd_project_graph(args) -> int:
     """Visualize the project DAG."""
-    import base64
-    import webbrowser
-    import zlib
-
     from .dag import build_dag, visualize_dag, visualize_dag_mermaid
+    from .project import load_project
 
     project = load_project(args.path)
     dag = build_dag(project)
@@ -457,22 +538,11 @@ def cmd_project_graph(args) -> int:
         mermaid_output = visualize_dag_mermaid(dag, direction=args.direction)
 
         if args.open:
+            import webbrowser
+
             # Extract just the mermaid code (without ```mermaid wrapper)
             mermaid_code = mermaid_output.replace("```mermaid\n", "").replace("\n```", "")
-
-            # Encode for mermaid.live URL
-            # mermaid.live uses pako compression + base64
-            json_state = json.dumps(
-                {
-                    "code": mermaid_code,
-                    "mermaid": {"theme": "default"},
-                    "autoSync": True,
-                    "updateDiagram": True,
-                }
-            )
-            compressed = zlib.compress(json_state.encode("utf-8"), level=9)
-            encoded = base64.urlsafe_b64encode(compressed).decode("ascii")
-            url = f"https://mermaid.live/edit#pako:{encoded}"
+            url = _mermaid_live_url(mermaid_code)
 
             print("Opening diagram in browser...")
             print(f"URL: {url[:80]}...")
@@ -485,31 +555,38 @@ def cmd_project_graph(args) -> int:
     return 0
 
 
+def _mermaid_live_url(mermaid_code: str) -> str:
+    """Build a mermaid.live editor URL (pako/zlib compression + base64)."""
+    import base64
+    import zlib
+
+    from .fastjson import dumps
+
+    compressed = zlib.compress(dumps({"code": mermaid_code, **_MERMAID_STATE}), level=6)
+    encoded = base64.urlsafe_b64encode(compressed).decode("ascii")
+    return f"https://mermaid.live/edit#pako:{encoded}"
+
+
 def cmd_project_runs(args) -> int:
     """List past runs for a project."""
+    from .artifacts import RunManifest
+
     project_path = Path(args.path).resolve()
     manifest_path = project_path / ".trident" / "runs" / "manifest.json"
 
-    manifest = RunManifest.load(manifest_path)
+    # Most recent runs first, limited
+    runs_to_show, total_runs = RunManifest.load_tail(manifest_path, args.limit)
 
-    if not manifest.runs:
+    if not total_runs:
         print("No runs found.")
         print(f"  Run a project with: trident project run {args.path}")
         return 0
 
-    # Show most recent runs (reversed, limited)
-    runs_to_show = list(reversed(manifest.runs))[: args.limit]
-
-    print(f"Recent runs ({len(runs_to_show)} of {len(manifest.runs)}):")
+    print(f"Recent runs ({len(runs_to_show)} of {total_runs}):")
     print()
 
     for run_entry in runs_to_show:
-        status_icon = {
-            "completed": "✓",
-            "failed": "✗",
-            "running": "…",
-            "interrupted": "⊘",
-        }.get(run_entry.status, "?")
+        status_icon = _STATUS_ICONS.get(run_entry.status, "?")
 
         success_str = ""
         if run_entry.success is not None:
@@ -528,18 +605,115 @@ def cmd_project_runs(args) -> int:
     return 0
 
 
+def _print_json(data) -> None:
+    """Print data as indented JSON to stdout.
+
+    With orjson the encoded bytes go straight to the stdout buffer; otherwise
+    the stdlib encoder streams its chunks so no single large string is built.
+    """
+    from . import fastjson
+
+    if not fastjson.ORJSON_AVAILABLE:
+        import json
+
+        json.dump(data, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+
+    encoded = fastjson.dumps(data, indent=True)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        print(encoded.decode("utf-8"))
+        return
+    # Flush pending text output first so ordering is preserved
+    sys.stdout.flush()
+    buffer.write(encoded + b"\n")
+    buffer.flush()
+
+
+def _emit_json(result, args) -> None:
+    """--output json: success flag, outputs, error and (with --trace) the trace."""
+    output = {
+        "success": result.success,
+        "outputs": result.outputs,
+    }
+    if result.error:
+        output["error"] = {
+            "node_id": result.error.node_id,
+            "node_type": result.error.node_type,
+            "message": str(result.error.args[0]),
+            "cause_type": result.error.cause_type,
+        }
+    if args.trace:
+        output["trace"] = {
+            "run_id": result.trace.run_id,
+            "start_time": result.trace.start_time,
+            "end_time": result.trace.end_time,
+            "nodes": [n.to_summary_dict() for n in result.trace.nodes],
+        }
+    _print_json(output)
+
+
+def _emit_text(result, args) -> None:
+    """--output text: one line per output value, errors to stderr."""
+    if not result.success:
+        print(f"FAILED: {result.error}", file=sys.stderr)
+    elif isinstance(result.outputs, dict):
+        import json
+
+        for _key, value in result.outputs.items():
+            if isinstance(value, dict):
+                print(json.dumps(value))
+            else:
+                print(value)
+    else:
+        print(result.outputs)
+
+
+def _emit_pretty(result, args) -> None:
+    """--output pretty: status header, trace on request or failure, outputs."""
+    # Collect header, trace and error sections and write them in one go
+    # rather than a print per line
+    header = "Complete" if result.success else "FAILED"
+    lines = [f"=== Execution {header} ===", ""]
+
+    if args.trace or not result.success:
+        lines.append("Trace:")
+        lines += map(_trace_line, result.trace.nodes)
+        lines.append("")
+
+    if result.error:
+        lines += ["Error:", f"  {result.error}", ""]
+
+    lines.append("Outputs:")
+    sys.stdout.write("\n".join(lines) + "\n")
+    _print_json(result.outputs)
+
+
+# `trident project run --output` choices
+_OUTPUT_EMITTERS = {"json": _emit_json, "text": _emit_text, "pretty": _emit_pretty}
+
+
 def cmd_project_run(args) -> int:
     """Execute a pipeline."""
+    import json
+
+    from . import fastjson
+    from .errors import ExitCode
+    from .executor import run
+    from .project import load_project
+
     project = load_project(args.path)
 
     # Parse inputs (priority: --input > --input-file > --input-from)
     inputs = {}
     if args.input:
-        inputs = json.loads(args.input)
+        inputs = fastjson.loads(args.input)
     elif args.input_file:
-        with open(args.input_file) as f:
-            inputs = json.load(f)
-    elif hasattr(args, "input_from") and args.input_from:
+        inputs = fastjson.loads(Path(args.input_file).read_bytes())
+    elif args.input_from:
+        from .artifacts import resolve_input_source
+
         try:
             inputs = resolve_input_source(args.input_from, project.root)
             if args.verbose:
@@ -563,6 +737,8 @@ def cmd_project_run(args) -> int:
     resume_from = None
     if args.resume:
         if args.resume == "latest":
+            from .artifacts import find_latest_run
+
             resume_from = find_latest_run(project.root)
             if not resume_from:
                 print("Error: No previous runs found to resume", file=sys.stderr)
@@ -573,7 +749,9 @@ def cmd_project_run(args) -> int:
             resume_from = args.resume
 
     # Wait for signals if specified
-    if hasattr(args, "wait_for") and args.wait_for:
+    if args.wait_for:
+        from .orchestration import SignalTimeoutError, wait_for_signal_files
+
         if args.verbose:
             print(f"Waiting for {len(args.wait_for)} signal(s)...")
         try:
@@ -590,14 +768,14 @@ def cmd_project_run(args) -> int:
             return ExitCode.TIMEOUT
 
     # Configure telemetry
-    telemetry_enabled = getattr(args, "telemetry", False)
+    telemetry_enabled = args.telemetry
     telemetry_config = None
     if telemetry_enabled:
         from .telemetry import TelemetryConfig, TelemetryLevel
 
         # Determine stdout behavior
         telemetry_stdout = args.telemetry_stdout
-        if not telemetry_stdout and not getattr(args, "telemetry_file", None):
+        if not telemetry_stdout and not args.telemetry_file:
             # Default to stdout if no file specified
             telemetry_stdout = True
 
@@ -608,14 +786,12 @@ def cmd_project_run(args) -> int:
             "warning": TelemetryLevel.WARNING,
             "error": TelemetryLevel.ERROR,
         }
-        telemetry_level = level_map.get(
-            getattr(args, "telemetry_level", "info"), TelemetryLevel.INFO
-        )
+        telemetry_level = level_map.get(args.telemetry_level, TelemetryLevel.INFO)
 
         telemetry_config = TelemetryConfig(
             enabled=True,
-            format=getattr(args, "telemetry_format", "jsonl"),
-            file_path=getattr(args, "telemetry_file", None),
+            format=args.telemetry_format,
+            file_path=args.telemetry_file,
             stdout=telemetry_stdout,
             level=telemetry_level,
         )
@@ -631,89 +807,12 @@ def cmd_project_run(args) -> int:
         run_id=args.run_id,
         resume_from=resume_from,
         start_from=args.start_from,
-        emit_signals=getattr(args, "emit_signal", False),
-        publish_to=getattr(args, "publish_to", None),
+        emit_signals=args.emit_signal,
+        publish_to=args.publish_to,
         telemetry_config=telemetry_config,
     )
 
-    # Output
-    if args.output == "json":
-        output = {
-            "success": result.success,
-            "outputs": result.outputs,
-        }
-        if result.error:
-            output["error"] = {
-                "node_id": result.error.node_id,
-                "node_type": result.error.node_type,
-                "message": str(result.error.args[0]),
-                "cause_type": result.error.cause_type,
-            }
-        if args.trace:
-            output["trace"] = {
-                "run_id": result.trace.run_id,
-                "start_time": result.trace.start_time,
-                "end_time": result.trace.end_time,
-                "nodes": [
-                    {
-                        "id": n.id,
-                        "start_time": n.start_time,
-                        "end_time": n.end_time,
-                        "model": n.model,
-                        "tokens": n.tokens,
-                        "skipped": n.skipped,
-                        "error": n.error,
-                        "error_type": n.error_type,
-                    }
-                    for n in result.trace.nodes
-                ],
-            }
-        print(json.dumps(output, indent=2))
-
-    elif args.output == "text":
-        if not result.success:
-            print(f"FAILED: {result.error}", file=sys.stderr)
-        elif isinstance(result.outputs, dict):
-            for _key, value in result.outputs.items():
-                if isinstance(value, dict):
-                    print(json.dumps(value))
-                else:
-                    print(value)
-        else:
-            print(result.outputs)
-
-    else:  # pretty
-        if result.success:
-            print("=== Execution Complete ===")
-        else:
-            print("=== Execution FAILED ===")
-        print()
-
-        if args.trace or not result.success:
-            print("Trace:")
-            for node in result.trace.nodes:
-                if node.error:
-                    status = "FAILED"
-                elif node.skipped:
-                    status = "SKIPPED"
-                else:
-                    status = "OK"
-                tokens = (
-                    f" ({node.tokens.get('input', 0)}+{node.tokens.get('output', 0)} tokens)"
-                    if node.tokens
-                    else ""
-                )
-                error_msg = f" - {node.error}" if node.error else ""
-                print(f"  [{status}] {node.id}{tokens}{error_msg}")
-            print()
-
-        if result.error:
-            print("Error:")
-            print(f"  {result.error}")
-            print()
-
-        print("Outputs:")
-        print(json.dumps(result.outputs, indent=2))
+    _OUTPUT_EMITTERS[args.output](result, args)
 
     # Return appropriate exit code
     if result.error:
@@ -723,6 +822,9 @@ def cmd_project_run(args) -> int:
 
 def cmd_project_schedule(args) -> int:
     """Generate scheduler configuration for workflow."""
+    from .errors import ExitCode
+    from .project import load_project
+
     project = load_project(args.path)
 
     # Check for orchestration config
@@ -737,23 +839,8 @@ def cmd_project_schedule(args) -> int:
         )
         return ExitCode.VALIDATION_ERROR
 
-    schedule = {}
-    if project.orchestration:
-        # Schedule config would need to be added to OrchestrationConfig
-        # For now, we'll check the raw manifest
-        from .parser import parse_yaml_simple
-
-        manifest_path = project.root / "agent.tml"
-        if not manifest_path.exists():
-            for candidate in ["trident.tml", "trident.yaml"]:
-                candidate_path = project.root / candidate
-                if candidate_path.exists():
-                    manifest_path = candidate_path
-                    break
-
-        manifest = parse_yaml_simple(manifest_path.read_text())
-        schedule = manifest.get("orchestration", {}).get("schedule", {})
-        depends_on = manifest.get("orchestration", {}).get("depends_on", [])
+    schedule = project.orchestration.schedule
+    depends_on = project.orchestration.depends_on
 
     if args.show:
         print(f"Project: {project.name}")
@@ -868,14 +955,25 @@ def cmd_project_schedule(args) -> int:
 
 def cmd_project_signals(args) -> int:
     """View and manage orchestration signals."""
+    from .artifacts import Signal
+    from .project import load_project
+
     project = load_project(args.path)
     signals_dir = project.root / ".trident" / "signals"
 
     if args.clear:
         if signals_dir.exists():
-            import shutil
-
-            shutil.rmtree(signals_dir)
+            # Signals are a flat directory of files; only recurse if
+            # something nested has been put there
+            with os.scandir(signals_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        import shutil
+
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+            os.rmdir(signals_dir)
             print(f"Cleared signals directory: {signals_dir}")
         else:
             print("No signals directory to clear")
@@ -890,27 +988,38 @@ def cmd_project_signals(args) -> int:
         print("No signals found")
         return 0
 
-    signal_files = list(signals_dir.glob("*"))
-    if not signal_files:
+    with os.scandir(signals_dir) as entries:
+        signal_names = sorted(entry.name for entry in entries)
+    if not signal_names:
         print("No signals found")
         return 0
 
     print("Current signals:")
-    for signal_path in sorted(signal_files):
+    for name in signal_names:
         try:
-            from .artifacts import Signal
-
-            signal = Signal.load(signal_path)
-            print(f"  {signal_path.name}")
+            signal = Signal.load(signals_dir / name)
+            print(f"  {name}")
             print(f"    Run ID: {signal.run_id}")
             print(f"    Timestamp: {signal.timestamp}")
             if signal.outputs_path:
                 print(f"    Outputs: {signal.outputs_path}")
         except Exception as e:
-            print(f"  {signal_path.name} (error reading: {e})")
+            print(f"  {name} (error reading: {e})")
 
     return 0
 
 
+# Handlers for `trident project <subcommand>`, keyed like _PROJECT_SUBCOMMANDS
+_PROJECT_HANDLERS = {
+    "init": cmd_project_init,
+    "run": cmd_project_run,
+    "validate": cmd_project_validate,
+    "graph": cmd_project_graph,
+    "runs": cmd_project_runs,
+    "schedule": cmd_project_schedule,
+    "signals": cmd_project_signals,
+}
+
+
 if __name__ == "__main__":
     sys.exit(main())
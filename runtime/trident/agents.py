@@ -6,12 +6,16 @@ Agents have access to tools and MCP servers for autonomous multi-turn execution.
 Requires: pip install trident[agents]
 """
 
+import asyncio
+import functools
 import json
 import os
+import re
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
+from . import fastjson
 from .errors import TridentError
 from .parser import AgentNode
 from .template import render
@@ -22,7 +26,6 @@ MessageCallback = Callable[[str, Any], None]
 
 # Check for SDK availability
 try:
-    import anyio
     from claude_agent_sdk import (
         AssistantMessage,
         ClaudeAgentOptions,
@@ -38,7 +41,7 @@ except ImportError:
     SDK_AVAILABLE = False
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentResult:
     """Result from agent execution with usage metrics.
 
@@ -63,6 +66,36 @@ class AgentExecutionError(TridentError):
     pass
 
 
+def _build_mcp_servers(mcp_servers: dict) -> dict[str, Any]:
+    """Build MCP server dicts (command, args, env) for the SDK and the CLI.
+
+    Env values of the form ``${VAR}`` are expanded from the environment at
+    call time; unset variables become empty strings.
+
+    Args:
+        mcp_servers: Dict of server name to MCPServerConfig objects
+
+    Returns:
+        Dict of server name to server config dict
+    """
+    environ = os.environ
+    servers: dict[str, Any] = {}
+    for server_name, server_config in mcp_servers.items():
+        server_dict: dict[str, Any] = {
+            "command": server_config.command,
+            "args": server_config.args,
+        }
+        if server_config.env:
+            server_dict["env"] = {
+                key: environ.get(value[2:-1], "")
+                if value.startswith("${") and value.endswith("}")
+                else value
+                for key, value in server_config.env.items()
+            }
+        servers[server_name] = server_dict
+    return servers
+
+
 def check_sdk_available() -> None:
     """Check if Claude Agent SDK is available.
 
@@ -109,24 +142,7 @@ async def execute_agent_async(
     rendered_prompt = render(agent_node.prompt_node.body, inputs)
 
     # Build MCP server config for SDK
-    mcp_servers: dict[str, Any] = {}
-    for server_name, server_config in agent_node.mcp_servers.items():
-        # Expand environment variables in server env
-        server_env = {}
-        for key, value in server_config.env.items():
-            if value.startswith("${") and value.endswith("}"):
-                env_var = value[2:-1]
-                server_env[key] = os.environ.get(env_var, "")
-            else:
-                server_env[key] = value
-
-        server_dict: dict[str, Any] = {
-            "command": server_config.command,
-            "args": server_config.args,
-        }
-        if server_env:
-            server_dict["env"] = server_env
-        mcp_servers[server_name] = server_dict
+    mcp_servers = _build_mcp_servers(agent_node.mcp_servers)
 
     # Determine working directory
     cwd = agent_node.cwd
@@ -162,8 +178,20 @@ async def execute_agent_async(
     try:
         async for message in query(prompt=rendered_prompt, options=options):
             if isinstance(message, AssistantMessage):
+                if on_message is None:
+                    # Without a callback only the text is used; skip building
+                    # the tool use/result payloads
+                    message_text_parts = [
+                        block.text  # type: ignore[union-attr]
+                        for block in message.content  # type: ignore[union-attr]
+                        if isinstance(block, TextBlock)
+                    ]
+                    if message_text_parts:
+                        last_assistant_text = "\n".join(message_text_parts)
+                    continue
+
                 # Collect all text blocks from this message
-                message_text_parts: list[str] = []
+                message_text_parts = []
                 tool_uses: list[dict[str, Any]] = []
                 tool_results: list[dict[str, Any]] = []
                 for block in message.content:  # type: ignore[union-attr]
@@ -183,18 +211,13 @@ async def execute_agent_async(
 
                 if message_text_parts:
                     last_assistant_text = "\n".join(message_text_parts)
-                    if on_message:
-                        on_message("assistant", last_assistant_text)
+                    on_message("assistant", last_assistant_text)
 
-                # Call callback for tool uses
-                if on_message and tool_uses:
-                    for tool_use in tool_uses:
-                        on_message("tool_use", tool_use)
-
-                # Call callback for tool results
-                if on_message and tool_results:
-                    for tool_result in tool_results:
-                        on_message("tool_result", tool_result)
+                # Call callback for tool uses, then tool results
+                for tool_use in tool_uses:
+                    on_message("tool_use", tool_use)
+                for tool_result in tool_results:
+                    on_message("tool_result", tool_result)
 
             elif isinstance(message, ResultMessage):
                 result_message = message
@@ -354,6 +377,26 @@ def _build_json_schema(fields: dict[str, tuple[str, str]]) -> dict[str, Any]:
     }
 
 
+# Fenced code blocks: ```json ... ```, and ``` ... ``` after an optional short
+# language line (e.g. ```javascript); the atomic group keeps a skipped language
+# line from being re-read as content
+_JSON_FENCE_RE = re.compile(r"```json(.*?)```", re.DOTALL)
+_FENCE_RE = re.compile(r"```(?>(?:[^\n]{1,19}\n)?)(.*?)```", re.DOTALL)
+
+# Stdlib decoder for raw_decode: parses one JSON value at an offset and
+# ignores whatever follows it
+_JSON_DECODER = json.JSONDecoder()
+
+# A brace followed by a key or a closing brace starts a JSON object; any other
+# brace (e.g. a "{name}" placeholder in prose) cannot
+_OBJECT_START_RE = re.compile(r'\{[ \t\n\r]*["}]')
+
+
+def _as_result(parsed: Any) -> dict[str, Any]:
+    """Return a parsed JSON object as-is; wrap arrays and primitives."""
+    return parsed if isinstance(parsed, dict) else {"result": parsed}
+
+
 def _parse_json_response(text: str) -> dict[str, Any]:
     """Parse JSON from agent response, handling markdown code blocks.
 
@@ -361,6 +404,7 @@ def _parse_json_response(text: str) -> dict[str, Any]:
     1. Direct JSON parse (response is pure JSON)
     2. ```json code block
     3. ``` code block (assumes JSON content)
+    4. First valid JSON object embedded in prose
 
     Args:
         text: Response text that may contain JSON
@@ -375,76 +419,31 @@ def _parse_json_response(text: str) -> dict[str, Any]:
 
     # Try direct parse first (cleanest case)
     try:
-        parsed = json.loads(text)
-        if isinstance(parsed, dict):
-            return parsed
-        # Handle array or primitive - wrap in dict
-        return {"result": parsed}
+        return _as_result(fastjson.loads(text))
     except json.JSONDecodeError:
         pass
 
-    # Try to extract from ```json code block
-    if "```json" in text:
-        start = text.find("```json") + 7
-        end = text.find("```", start)
-        if end > start:
+    # Try a ```json code block, then any ``` code block
+    for fence in (_JSON_FENCE_RE, _FENCE_RE):
+        match = fence.search(text)
+        if match:
             try:
-                parsed = json.loads(text[start:end].strip())
-                if isinstance(parsed, dict):
-                    return parsed
-                return {"result": parsed}
+                return _as_result(fastjson.loads(match.group(1).strip()))
             except json.JSONDecodeError:
                 pass  # Fall through to next attempt
 
-    # Try to extract from plain ``` code block
-    if "```" in text:
-        start = text.find("```") + 3
-        # Skip language identifier if present (e.g., ```javascript)
-        newline = text.find("\n", start)
-        if newline > start and newline - start < 20:  # Reasonable language id length
-            start = newline + 1
-        end = text.find("```", start)
-        if end > start:
-            try:
-                parsed = json.loads(text[start:end].strip())
-                if isinstance(parsed, dict):
-                    return parsed
-                return {"result": parsed}
-            except json.JSONDecodeError:
-                pass
-
-    # Try to find JSON object embedded in prose (e.g., "Here's the output: {...}")
+    # Try to find JSON object embedded in prose (e.g., "Here's the output: {...}").
+    # raw_decode scans to the matching brace in C, honouring strings and escapes.
+    # Braces that cannot start an object are skipped, but a malformed or
+    # truncated object is an error rather than a reason to parse its fragments
     brace_start = text.find("{")
-    if brace_start >= 0:
-        # Find matching closing brace
-        depth = 0
-        in_string = False
-        escape_next = False
-        for i, char in enumerate(text[brace_start:], brace_start):
-            if escape_next:
-                escape_next = False
-                continue
-            if char == "\\":
-                escape_next = True
-                continue
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
-            if in_string:
-                continue
-            if char == "{":
-                depth += 1
-            elif char == "}":
-                depth -= 1
-                if depth == 0:
-                    try:
-                        parsed = json.loads(text[brace_start : i + 1])
-                        if isinstance(parsed, dict):
-                            return parsed
-                        return {"result": parsed}
-                    except json.JSONDecodeError:
-                        pass
-                    break
+    while brace_start >= 0:
+        try:
+            return _as_result(_JSON_DECODER.raw_decode(text, brace_start)[0])
+        except json.JSONDecodeError:
+            if _OBJECT_START_RE.match(text, brace_start):
+                break
+            brace_start = text.find("{", brace_start + 1)
 
     raise json.JSONDecodeError(
         "No valid JSON found in response. Expected raw JSON or markdown code block.",
@@ -453,6 +452,19 @@ def _parse_json_response(text: str) -> dict[str, Any]:
     )
 
 
+@functools.cache
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory if it is installed, else None (asyncio default).
+
+    Resolved on first agent call, so runs without agent nodes never import uvloop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 def execute_agent(
     agent_node: AgentNode,
     inputs: dict[str, Any],
@@ -473,6 +485,8 @@ def execute_agent(
         AgentResult with output and usage metrics
     """
     check_sdk_available()
-    return anyio.run(
-        execute_agent_async, agent_node, inputs, project_root, resume_session, on_message
-    )
+    # Each call gets its own loop (uvloop when installed), closed on return
+    with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+        return runner.run(
+            execute_agent_async(agent_node, inputs, project_root, resume_session, on_message)
+        )
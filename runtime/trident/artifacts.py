@@ -13,14 +13,22 @@ Signals are stored in `.trident/signals/` for cross-run coordination.
 """
 
 import json
+import os
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from . import fastjson
+
 if TYPE_CHECKING:
     from .executor import Checkpoint, ExecutionTrace
 
+# File in the runs directory holding the newest run ID. The leading dot keeps it
+# out of the namespace of run directories, so `--run-id latest` is unaffected.
+LATEST_FILE = ".latest"
+
 
 @dataclass
 class ArtifactConfig:
@@ -79,6 +87,26 @@ class RunManifest:
             # Corrupted manifest - start fresh
             return cls()
 
+    @classmethod
+    def load_tail(cls, path: Path, n: int) -> tuple[list[RunEntry], int]:
+        """Load the n most recent runs, newest first, plus the total run count.
+
+        Only the requested entries are turned into RunEntry objects, so listing
+        recent runs stays cheap on long histories.
+        """
+        if not path.exists():
+            return [], 0
+        try:
+            data = fastjson.loads(path.read_bytes())
+            if not isinstance(data, dict):
+                return [], 0
+            runs = data.get("runs", [])
+            recent = islice(reversed(runs), max(n, 0))
+            return [RunEntry.from_dict(r) for r in recent], len(runs)
+        except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+            # Corrupted manifest - nothing to show
+            return [], 0
+
     def save(self, path: Path) -> None:
         """Save manifest to disk."""
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -224,6 +252,8 @@ class OrchestrationConfig:
     export_path: str | None = None  # Absolute path for cross-project sharing
     signals_enabled: bool = True
     signals_dir: str = ".trident/signals"
+    schedule: dict[str, Any] = field(default_factory=dict)  # e.g. {"cron": "0 * * * *"}
+    depends_on: list[dict[str, Any]] = field(default_factory=list)  # Upstream workflow signals
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "OrchestrationConfig":
@@ -237,6 +267,8 @@ class OrchestrationConfig:
             export_path=data.get("export", {}).get("path"),
             signals_enabled=signals.get("enabled", True),
             signals_dir=signals.get("directory", ".trident/signals"),
+            schedule=data.get("schedule") or {},
+            depends_on=data.get("depends_on") or [],
         )
 
 
@@ -276,6 +308,11 @@ class ArtifactManager:
         """Path to the runs manifest."""
         return self.runs_dir / "manifest.json"
 
+    @property
+    def latest_path(self) -> Path:
+        """File recording the ID of the most recently registered run."""
+        return self.runs_dir / LATEST_FILE
+
     @property
     def checkpoint_path(self) -> Path:
         """Path to checkpoint file."""
@@ -355,6 +392,18 @@ class ArtifactManager:
         )
         manifest.add_run(entry)
         self._save_manifest()
+        if manifest.runs[-1].run_id == self.run_id:
+            self._update_latest_pointer()
+
+    def _update_latest_pointer(self) -> None:
+        """Record this run as the latest one (best effort)."""
+        tmp_path = self.runs_dir / f"{LATEST_FILE}.{os.getpid()}.tmp"
+        try:
+            tmp_path.write_text(self.run_id)
+            os.replace(tmp_path, self.latest_path)
+        except OSError:
+            # find_latest_run falls back to the manifest
+            tmp_path.unlink(missing_ok=True)
 
     def update_run_status(
         self,
@@ -430,8 +479,8 @@ class ArtifactManager:
             return self.trace_path
 
         self.ensure_dirs()
-        data = trace.to_dict()
-        self.trace_path.write_text(json.dumps(data, indent=2, default=str))
+        # Encode the dataclasses directly, without an intermediate to_dict() copy
+        self.trace_path.write_bytes(fastjson.dumps(trace, indent=True, default=str))
         return self.trace_path
 
     def save_outputs(
@@ -613,10 +662,18 @@ def find_latest_run(project_root: Path) -> str | None:
     Returns:
         Run ID of the most recent run, or None if no runs exist
     """
-    manifest_path = project_root / ".trident" / "runs" / "manifest.json"
-    manifest = RunManifest.load(manifest_path)
-    latest = manifest.get_latest()
-    return latest.run_id if latest else None
+    runs_dir = project_root / ".trident" / "runs"
+    # Fast path: the pointer kept current by register_run, as long as it still
+    # names an existing run directory
+    try:
+        run_id = (runs_dir / LATEST_FILE).read_text()
+    except OSError:
+        run_id = ""
+    if run_id and (runs_dir / run_id).is_dir():
+        return run_id
+
+    latest, _ = RunManifest.load_tail(runs_dir / "manifest.json", 1)
+    return latest[0].run_id if latest else None
 
 
 def resolve_input_source(source: str, project_root: Path) -> dict[str, Any]:
@@ -652,4 +709,4 @@ def resolve_input_source(source: str, project_root: Path) -> dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Input source not found: {path}")
 
-    return json.loads(path.read_text())
+    return fastjson.loads(path.read_bytes())
@@ -21,6 +21,7 @@ Usage in manifest:
           - Bash
 """
 
+import functools
 import json
 import os
 import shutil
@@ -28,12 +29,13 @@ import subprocess
 from dataclasses import dataclass, field
 from typing import Any
 
+from .agents import _build_mcp_servers, _parse_json_response
 from .errors import TridentError
 from .parser import AgentNode
 from .template import render
 
 
-@dataclass
+@dataclass(slots=True)
 class CLIAgentResult:
     """Result from CLI-based agent execution.
 
@@ -124,28 +126,13 @@ def _build_mcp_config(mcp_servers: dict) -> dict[str, Any]:
     Returns:
         Dict in the format expected by Claude CLI's --mcp-config
     """
-    config: dict[str, Any] = {"mcpServers": {}}
-
-    for server_name, server_config in mcp_servers.items():
-        # Expand environment variables in server env
-        server_env = {}
-        for key, value in server_config.env.items():
-            if value.startswith("${") and value.endswith("}"):
-                env_var = value[2:-1]
-                server_env[key] = os.environ.get(env_var, "")
-            else:
-                server_env[key] = value
-
-        server_dict: dict[str, Any] = {
-            "command": server_config.command,
-            "args": server_config.args,
-        }
-        if server_env:
-            server_dict["env"] = server_env
+    return {"mcpServers": _build_mcp_servers(mcp_servers)}
 
-        config["mcpServers"][server_name] = server_dict
 
-    return config
+@functools.lru_cache(maxsize=8)
+def _which_claude(search_path: str | None) -> str | None:
+    """Locate the claude executable; cached per PATH value."""
+    return shutil.which("claude", path=search_path)
 
 
 def check_cli_available() -> str:
@@ -157,7 +144,7 @@ def check_cli_available() -> str:
     Raises:
         CLIAgentError: If CLI is not installed or not in PATH
     """
-    claude_path = shutil.which("claude")
+    claude_path = _which_claude(os.environ.get("PATH"))
     if not claude_path:
         raise CLIAgentError(
             "Claude CLI not found. Install with: npm install -g @anthropic-ai/claude-code\n"
@@ -336,96 +323,3 @@ def execute_agent_via_cli(
         cost_usd=cli_output.get("total_cost_usd"),
         tokens=tokens,
     )
-
-
-def _parse_json_response(text: str) -> dict[str, Any]:
-    """Parse JSON from agent response, handling markdown code blocks.
-
-    This mirrors the logic in agents.py for consistency.
-
-    Args:
-        text: Response text that may contain JSON
-
-    Returns:
-        Parsed JSON as dictionary
-
-    Raises:
-        json.JSONDecodeError: If no valid JSON found
-    """
-    text = text.strip()
-
-    # Try direct parse first
-    try:
-        parsed = json.loads(text)
-        if isinstance(parsed, dict):
-            return parsed
-        return {"result": parsed}
-    except json.JSONDecodeError:
-        pass
-
-    # Try to extract from ```json code block
-    if "```json" in text:
-        start = text.find("```json") + 7
-        end = text.find("```", start)
-        if end > start:
-            try:
-                parsed = json.loads(text[start:end].strip())
-                if isinstance(parsed, dict):
-                    return parsed
-                return {"result": parsed}
-            except json.JSONDecodeError:
-                pass
-
-    # Try to extract from plain ``` code block
-    if "```" in text:
-        start = text.find("```") + 3
-        newline = text.find("\n", start)
-        if newline > start and newline - start < 20:
-            start = newline + 1
-        end = text.find("```", start)
-        if end > start:
-            try:
-                parsed = json.loads(text[start:end].strip())
-                if isinstance(parsed, dict):
-                    return parsed
-                return {"result": parsed}
-            except json.JSONDecodeError:
-                pass
-
-    # Try to find JSON object embedded in prose
-    brace_start = text.find("{")
-    if brace_start >= 0:
-        depth = 0
-        in_string = False
-        escape_next = False
-        for i, char in enumerate(text[brace_start:], brace_start):
-            if escape_next:
-                escape_next = False
-                continue
-            if char == "\\":
-                escape_next = True
-                continue
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
-            if in_string:
-                continue
-            if char == "{":
-                depth += 1
-            elif char == "}":
-                depth -= 1
-                if depth == 0:
-                    try:
-                        parsed = json.loads(text[brace_start : i + 1])
-                        if isinstance(parsed, dict):
-                            return parsed
-                        return {"result": parsed}
-                    except json.JSONDecodeError:
-                        pass
-                    break
-
-    raise json.JSONDecodeError(
-        "No valid JSON found in response. Expected raw JSON or markdown code block.",
-        text,
-        0,
-    )
@@ -1,10 +1,11 @@
 """DAG construction and validation."""
 
+import sys
 from dataclasses import dataclass, field
 
 from .errors import DAGError
 from .project import Edge, Project
-from .tools.python import get_tool_parameters
+from .tools.python import get_tool_parameters, preload_tool_parameters
 
 
 @dataclass
@@ -42,6 +43,7 @@ class DAG:
     nodes: dict[str, DAGNode]
     execution_order: list[str]  # Topologically sorted node IDs (flat, for backward compat)
     execution_levels: list[list[str]]  # Nodes grouped by level (parallel within level)
+    index_of: dict[str, int] = field(default_factory=dict)  # Node ID -> position in execution_order
 
 
 def get_node_output_fields(project: Project, node_id: str, node_type: str) -> set[str]:
@@ -110,13 +112,29 @@ def get_node_output_fields(project: Project, node_id: str, node_type: str) -> se
     return set()
 
 
-def get_node_input_fields(project: Project, node_id: str, node_type: str) -> set[str]:
+def _tool_parameters(
+    project: Project, node_id: str, tool_params: dict[str, set[str] | None] | None
+) -> set[str] | None:
+    """Look up a tool node's parameter names, preferring preloaded results."""
+    if tool_params is not None and node_id in tool_params:
+        return tool_params[node_id]
+    tool_def = project.tools.get(node_id)
+    return get_tool_parameters(project.root, tool_def) if tool_def else None
+
+
+def get_node_input_fields(
+    project: Project,
+    node_id: str,
+    node_type: str,
+    tool_params: dict[str, set[str] | None] | None = None,
+) -> set[str]:
     """Get the fields a node expects as input.
 
     Args:
         project: The loaded project
         node_id: ID of the node
         node_type: Type of the node
+        tool_params: Tool parameters from preload_tool_parameters, if already known
 
     Returns:
         Set of field names expected by the node, or empty set if any field is accepted
@@ -140,11 +158,9 @@ def get_node_input_fields(project: Project, node_id: str, node_type: str) -> set
 
     elif node_type == "tool":
         # Introspect tool function signature for parameter names
-        if node_id in project.tools:
-            tool_def = project.tools[node_id]
-            params = get_tool_parameters(project.root, tool_def)
-            if params is not None:
-                return params
+        params = _tool_parameters(project, node_id, tool_params)
+        if params is not None:
+            return params
         # Fallback: can't determine, accept anything
         return set()
 
@@ -227,13 +243,19 @@ def get_node_output_types(project: Project, node_id: str, node_type: str) -> dic
     return {}
 
 
-def get_node_input_types(project: Project, node_id: str, node_type: str) -> dict[str, str | None]:
+def get_node_input_types(
+    project: Project,
+    node_id: str,
+    node_type: str,
+    tool_params: dict[str, set[str] | None] | None = None,
+) -> dict[str, str | None]:
     """Get the fields and their expected types for a node's inputs.
 
     Args:
         project: The loaded project
         node_id: ID of the node
         node_type: Type of the node
+        tool_params: Tool parameters from preload_tool_parameters, if already known
 
     Returns:
         Dict mapping field names to their expected types (None if any type accepted)
@@ -257,11 +279,9 @@ def get_node_input_types(project: Project, node_id: str, node_type: str) -> dict
     elif node_type == "tool":
         # Tool parameter types from introspection would require more work
         # For now, return None (accept any type) for tool params
-        if node_id in project.tools:
-            tool_def = project.tools[node_id]
-            params = get_tool_parameters(project.root, tool_def)
-            if params is not None:
-                return {p: None for p in params}  # Type unknown
+        params = _tool_parameters(project, node_id, tool_params)
+        if params is not None:
+            return {p: None for p in params}  # Type unknown
         return {}
 
     # output, input, branch, trigger nodes accept any types
@@ -312,6 +332,9 @@ def validate_edge_mappings(project: Project, dag: "DAG", strict: bool = False) -
     """
     result = ValidationResult(valid=True)
 
+    # Introspect all tool signatures up front rather than once per edge lookup
+    tool_params = preload_tool_parameters(project)
+
     for edge in project.edges.values():
         source_node = dag.nodes.get(edge.from_node)
         target_node = dag.nodes.get(edge.to_node)
@@ -321,11 +344,11 @@ def validate_edge_mappings(project: Project, dag: "DAG", strict: bool = False) -
             continue
 
         source_fields = get_node_output_fields(project, edge.from_node, source_node.type)
-        target_fields = get_node_input_fields(project, edge.to_node, target_node.type)
+        target_fields = get_node_input_fields(project, edge.to_node, target_node.type, tool_params)
 
         # Get type information for type checking
         source_types = get_node_output_types(project, edge.from_node, source_node.type)
-        target_types = get_node_input_types(project, edge.to_node, target_node.type)
+        target_types = get_node_input_types(project, edge.to_node, target_node.type, tool_params)
 
         for mapping in edge.mappings:
             # Validate source field
@@ -566,14 +589,17 @@ def build_dag(project: Project, validate_mappings_flag: bool = False) -> DAG:
         remaining = set(nodes.keys()) - set(execution_order)
         raise DAGError(f"Cycle detected in DAG. Nodes involved: {remaining}")
 
-    dag = DAG(nodes=nodes, execution_order=execution_order, execution_levels=execution_levels)
+    dag = DAG(
+        nodes=nodes,
+        execution_order=execution_order,
+        execution_levels=execution_levels,
+        index_of={node_id: i for i, node_id in enumerate(execution_order)},
+    )
 
     # Optionally validate edge mappings
     if validate_mappings_flag:
         validation = validate_edge_mappings(project, dag)
         if validation.warnings:
-            import sys
-
             print("Edge mapping warnings:", file=sys.stderr)
             for warning in validation.warnings:
                 print(f"  ⚠ {warning.message}", file=sys.stderr)
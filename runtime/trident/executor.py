@@ -2,8 +2,10 @@
 
 import asyncio
 import contextlib
+import functools
 import json
 import os
+import sys
 from collections.abc import Callable
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
@@ -42,7 +44,7 @@ except ImportError:
 from .cli_agents import execute_agent_via_cli
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeTrace:
     """Execution trace for a single node."""
 
@@ -76,6 +78,37 @@ class NodeTrace:
         """Check if this node executed successfully."""
         return self.error is None and not self.skipped
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to JSON-serializable dict."""
+        return {
+            "id": self.id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "input": self.input,
+            "output": self.output,
+            "model": self.model,
+            "tokens": self.tokens,
+            "skipped": self.skipped,
+            "error": self.error,
+            "error_type": self.error_type,
+            "cost_usd": self.cost_usd,
+            "session_id": self.session_id,
+            "num_turns": self.num_turns,
+        }
+
+    def to_summary_dict(self) -> dict[str, Any]:
+        """Convert to a dict without inputs, outputs or agent metrics (CLI --trace)."""
+        return {
+            "id": self.id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "model": self.model,
+            "tokens": self.tokens,
+            "skipped": self.skipped,
+            "error": self.error,
+            "error_type": self.error_type,
+        }
+
 
 @dataclass
 class ExecutionTrace:
@@ -107,7 +140,7 @@ class ExecutionTrace:
             "start_time": self.start_time,
             "end_time": self.end_time,
             "error": self.error,
-            "nodes": [asdict(n) for n in self.nodes],
+            "nodes": [n.to_dict() for n in self.nodes],
         }
 
 
@@ -343,29 +376,32 @@ def _should_execute(edge: Edge, source_output: dict[str, Any]) -> bool:
         return False
 
 
+# Mock value per schema field type; unknown types mock as null
+_MOCK_VALUES: dict[str, Any] = {"number": 0, "boolean": True, "array": [], "object": {}}
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_mock(fields: tuple[tuple[str, str], ...]) -> str:
+    """Build the mock JSON text for a schema, given (field_name, field_type) pairs."""
+    mock = {
+        name: f"[mock_{name}]" if field_type == "string" else _MOCK_VALUES.get(field_type)
+        for name, field_type in fields
+    }
+    return json.dumps(mock)
+
+
 def _generate_mock_output(prompt_node: PromptNode) -> dict[str, Any]:
     """Generate mock output for dry-run mode based on output schema."""
     if prompt_node.output.format == "text":
         return {"text": "[DRY RUN] Mock text response"}
 
     # JSON format - generate mock data matching schema
-    # Include text field (raw JSON) + schema fields for consistency
-    mock: dict[str, Any] = {}
-    for field_name, (field_type, _desc) in prompt_node.output.fields.items():
-        if field_type == "string":
-            mock[field_name] = f"[mock_{field_name}]"
-        elif field_type == "number":
-            mock[field_name] = 0
-        elif field_type == "boolean":
-            mock[field_name] = True
-        elif field_type == "array":
-            mock[field_name] = []
-        elif field_type == "object":
-            mock[field_name] = {}
-        else:
-            mock[field_name] = None
-    # Include text field with JSON representation
-    return {"text": json.dumps(mock), **mock}
+    # Include text field (raw JSON) + schema fields for consistency.
+    # The JSON text is built once per schema; decoding it gives fresh containers per call.
+    text = _compile_mock(
+        tuple((name, field_type) for name, (field_type, _desc) in prompt_node.output.fields.items())
+    )
+    return {"text": text, **json.loads(text)}
 
 
 def run(
@@ -416,23 +452,16 @@ def run(
     setup_providers()
     registry = get_registry()
 
-    # Initialize telemetry if configured
-    telemetry_emitter = None
-    if telemetry_config and telemetry_config.enabled:
-        from .telemetry import TelemetryEmitter, set_emitter
-
-        telemetry_emitter = TelemetryEmitter(telemetry_config)
-        set_emitter(telemetry_emitter)
-
     # Build DAG - this can raise DAGError for cycles/invalid structure
     dag = build_dag(project)
 
+    # Parse all prompt files up front so malformed prompts fail before any node runs
+    project.prompts.load_all()
+
     # Validate edge mappings - print warnings in dry-run or verbose mode
     if dry_run or verbose:
         validation = validate_edge_mappings(project, dag)
         if validation.warnings:
-            import sys
-
             print("⚠ Edge mapping warnings:", file=sys.stderr)
             for warning in validation.warnings:
                 print(f"  - {warning.message}", file=sys.stderr)
@@ -527,6 +556,15 @@ def run(
 
     trace = ExecutionTrace(run_id=effective_run_id, start_time=_now_iso())
 
+    # Initialize telemetry once setup has been validated, so setup errors
+    # never leave an open emitter installed globally
+    telemetry_emitter = None
+    if telemetry_config and telemetry_config.enabled:
+        from .telemetry import TelemetryEmitter, set_emitter
+
+        telemetry_emitter = TelemetryEmitter(telemetry_config)
+        set_emitter(telemetry_emitter)
+
     # Emit workflow started event
     if telemetry_emitter:
         from .telemetry import EventType, TelemetryLevel
@@ -605,6 +643,9 @@ def run(
         for node_id, node_data in checkpoint.completed_nodes.items():
             node_outputs[node_id] = node_data.outputs
 
+    # Node traces are stored by execution position; the DAG size is known up front
+    node_slots: list[NodeTrace | None] = [None] * len(dag.execution_order)
+
     # Execute nodes level by level (parallel within each level)
     async def _execute_levels() -> None:
         nonlocal execution_error
@@ -632,7 +673,7 @@ def run(
                 node_trace.cost_usd = node_data.cost_usd
                 node_trace.num_turns = node_data.num_turns
                 node_trace.end_time = node_data.completed_at
-                trace.nodes.append(node_trace)
+                node_slots[dag.index_of[node_id]] = node_trace
                 if verbose:
                     print(f"Skipping completed node: {node_id}")
 
@@ -667,7 +708,7 @@ def run(
 
             # Process results from this level
             for result in results:
-                trace.nodes.append(result.node_trace)
+                node_slots[dag.index_of[result.node_id]] = result.node_trace
 
                 if result.error:
                     # First error fails the execution
@@ -727,6 +768,8 @@ def run(
 
     # Run the async execution
     asyncio.run(_execute_levels())
+    # Nodes after a failed level never ran and leave empty slots
+    trace.nodes = [n for n in node_slots if n is not None]
 
     # Collect final outputs from output nodes (even partial on failure)
     final_outputs: dict[str, Any] = {}
@@ -998,7 +1041,7 @@ async def _execute_node_async(
 
         elif node.type == "agent":
             session_to_resume = resume_sessions.get(node_id) if resume_sessions else None
-            # Agent execution already supports async via asyncio.run inside
+            # Agent execution runs its async SDK calls on its own event loop
             await asyncio.to_thread(
                 _execute_agent_node,
                 node_id,
@@ -1507,7 +1550,6 @@ def _execute_trigger_node(
     - output: dict - Downstream workflow outputs (wait mode only)
     """
     import subprocess
-    import sys
 
     from .project import load_project
 
@@ -0,0 +1,63 @@
+"""JSON encoding helpers that use orjson when it is installed.
+
+orjson is optional (``pip install trident[fast]``); without it these fall back
+to the standard library with equivalent output. Dataclass instances are
+serialized field by field with either backend.
+"""
+
+import dataclasses
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any, *, indent: bool = False, default: Callable[[Any], Any] | None = None) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, optionally indented by two spaces.
+
+    Args:
+        obj: Value to encode; may contain dataclass instances
+        indent: Indent nested structures by two spaces
+        default: Called for values that are not otherwise serializable
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj,
+                default=default,
+                option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0),
+            )
+        except TypeError:
+            pass  # Types orjson can't encode (e.g. big ints); let json decide
+
+    def encode_default(value: Any) -> Any:
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            # Shallow: nested dataclasses come back through here
+            return {f.name: getattr(value, f.name) for f in dataclasses.fields(value)}
+        if default is not None:
+            return default(value)
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    # ensure_ascii=False writes raw UTF-8 like orjson, so both backends agree
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False, default=encode_default)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=encode_default)
+    return text.encode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON from str or bytes. Raises json.JSONDecodeError on bad input.
+
+    With orjson, integers outside the 64-bit range decode as float.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -144,24 +144,34 @@ def parse_yaml_simple(text: str) -> dict[str, Any]:
 
 
 def parse_prompt_file(path: Path) -> PromptNode:
-    """Parse a .prompt file into a PromptNode.
+    """Parse a .prompt file into a PromptNode."""
+    try:
+        content = path.read_text(encoding="utf-8")
+    except Exception as e:
+        raise ParseError(f"Cannot read {path}: {e}") from e
+    return parse_prompt_string(content, path)
+
+
+def parse_prompt_string(content: str, path: Path | None = None) -> PromptNode:
+    """Parse .prompt source text into a PromptNode.
 
     Format:
         ---
         <frontmatter: YAML>
         ---
         <body: template text>
+
+    Args:
+        content: Prompt source text
+        path: File the text came from, used in error messages and PromptNode.file_path
     """
-    try:
-        content = path.read_text(encoding="utf-8")
-    except Exception as e:
-        raise ParseError(f"Cannot read {path}: {e}") from e
+    source = path or "<string>"
 
     # Split frontmatter and body
     parts = re.split(r"^---\s*$", content, maxsplit=2, flags=re.MULTILINE)
 
     if len(parts) < 3:
-        raise ParseError(f"Invalid .prompt format in {path}: missing frontmatter delimiters")
+        raise ParseError(f"Invalid .prompt format in {source}: missing frontmatter delimiters")
 
     frontmatter_text = parts[1].strip()
     body = parts[2].strip()
@@ -170,10 +180,10 @@ def parse_prompt_file(path: Path) -> PromptNode:
     try:
         fm = parse_yaml_simple(frontmatter_text)
     except Exception as e:
-        raise ParseError(f"Invalid YAML in {path}: {e}") from e
+        raise ParseError(f"Invalid YAML in {source}: {e}") from e
 
     if "id" not in fm:
-        raise ParseError(f"Missing required 'id' in {path}")
+        raise ParseError(f"Missing required 'id' in {source}")
 
     # Build PromptNode
     node = PromptNode(
@@ -216,7 +226,7 @@ def parse_prompt_file(path: Path) -> PromptNode:
                     node.output.fields[fname] = (field_type, field_desc)
                 else:
                     raise ParseError(
-                        f"Invalid schema field '{fname}' in {path}: "
+                        f"Invalid schema field '{fname}' in {source}: "
                         f"expected dict with 'type' and 'description', got {type(fspec).__name__}"
                     )
 
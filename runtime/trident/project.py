@@ -1,6 +1,8 @@
 """Project and manifest loading."""
 
 import os
+from collections.abc import Iterator, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -65,6 +67,76 @@ class ToolDef:
     description: str = ""
 
 
+class PromptRegistry(MutableMapping[str, PromptNode]):
+    """Prompt nodes indexed by file stem, parsed on first access.
+
+    Prompt files are only read and parsed when a node is looked up, so
+    commands that touch a handful of prompts don't pay for the whole
+    ``prompts/`` directory. A prompt's frontmatter ``id`` must match its
+    filename.
+    """
+
+    def __init__(self, paths: dict[str, Path] | None = None):
+        self._paths: dict[str, Path] = dict(paths or {})
+        self._cache: dict[str, PromptNode] = {}
+
+    @classmethod
+    def from_dir(cls, prompts_dir: Path) -> "PromptRegistry":
+        """Index all ``*.prompt`` files in a directory without parsing them."""
+        return cls({p.stem: p for p in prompts_dir.glob("*.prompt")})
+
+    def __getitem__(self, key: str) -> PromptNode:
+        node = self._cache.get(key)
+        if node is not None:
+            return node
+        path = self._paths[key]
+        try:
+            node = parse_prompt_file(path)
+        except ParseError:
+            raise
+        except Exception as e:
+            raise ParseError(f"Error parsing {path}: {e}") from e
+        if node.id != key:
+            raise ParseError(f"Prompt id '{node.id}' in {path} does not match filename '{key}'")
+        self._cache[key] = node
+        return node
+
+    def load_all(self) -> None:
+        """Parse every prompt not yet loaded, reading files on a thread pool.
+
+        Raises:
+            ParseError: If any prompt file fails to parse
+        """
+        pending = sorted(self._paths.keys() - self._cache.keys())
+        if not pending:
+            return
+        with ThreadPoolExecutor(max_workers=min(32, len(pending))) as pool:
+            # Iterating the results re-raises the first parse error
+            list(pool.map(self.__getitem__, pending))
+
+    def __setitem__(self, key: str, node: PromptNode) -> None:
+        self._paths.pop(key, None)
+        self._cache[key] = node
+
+    def __delitem__(self, key: str) -> None:
+        found = self._paths.pop(key, None) is not None
+        if self._cache.pop(key, None) is None and not found:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._paths or key in self._cache
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._paths.keys() - self._cache.keys()
+        yield from self._cache
+
+    def __len__(self) -> int:
+        return len(self._paths.keys() | self._cache.keys())
+
+    def __repr__(self) -> str:
+        return f"PromptRegistry({sorted(self)!r})"
+
+
 @dataclass
 class Project:
     """Loaded Trident project."""
@@ -76,7 +148,7 @@ class Project:
     defaults: dict[str, Any] = field(default_factory=dict)
     entrypoints: list[str] = field(default_factory=list)
     edges: dict[str, Edge] = field(default_factory=dict)
-    prompts: dict[str, PromptNode] = field(default_factory=dict)
+    prompts: PromptRegistry = field(default_factory=PromptRegistry)
     input_nodes: dict[str, InputNode] = field(default_factory=dict)
     output_nodes: dict[str, OutputNode] = field(default_factory=dict)
     tools: dict[str, ToolDef] = field(default_factory=dict)
@@ -341,17 +413,10 @@ def load_project(path: str | Path) -> Project:
                 description=tool_spec.get("description", ""),
             )
 
-    # Discover and parse prompt files
+    # Index prompt files; they are parsed lazily on first access
     prompts_dir = root / "prompts"
     if prompts_dir.exists():
-        for prompt_file in prompts_dir.glob("*.prompt"):
-            try:
-                node = parse_prompt_file(prompt_file)
-                project.prompts[node.id] = node
-            except ParseError:
-                raise
-            except Exception as e:
-                raise ParseError(f"Error parsing {prompt_file}: {e}") from e
+        project.prompts = PromptRegistry.from_dir(prompts_dir)
 
     # Create implicit input/output nodes if referenced but not defined
     all_from_nodes = {e.from_node for e in project.edges.values()}
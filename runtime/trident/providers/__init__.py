@@ -1,15 +1,25 @@
-"""Model providers."""
+"""Model providers.
+
+The built-in providers are imported on first use: their HTTP stack
+(urllib.request and http.client) is only loaded by pipelines that call a model.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
 
-from .anthropic import AnthropicProvider
 from .base import (
     CompletionConfig,
     CompletionResult,
     Provider,
     ProviderRegistry,
     get_registry,
+    register_lazy_provider,
     register_provider,
 )
-from .openai import OpenAIProvider
+
+if TYPE_CHECKING:
+    from .anthropic import AnthropicProvider
+    from .openai import OpenAIProvider
 
 __all__ = [
     "Provider",
@@ -17,13 +27,45 @@ __all__ = [
     "CompletionConfig",
     "CompletionResult",
     "get_registry",
+    "register_lazy_provider",
     "register_provider",
     "AnthropicProvider",
     "OpenAIProvider",
 ]
 
+# Built-in provider classes: name -> submodule, resolved by __getattr__
+_LAZY: dict[str, str] = {
+    "AnthropicProvider": ".anthropic",
+    "OpenAIProvider": ".openai",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+def _anthropic() -> Provider:
+    from .anthropic import AnthropicProvider
+
+    return AnthropicProvider()
+
+
+def _openai() -> Provider:
+    from .openai import OpenAIProvider
+
+    return OpenAIProvider()
+
 
 def setup_providers() -> None:
     """Initialize and register built-in providers."""
-    register_provider(AnthropicProvider())
-    register_provider(OpenAIProvider())
+    register_lazy_provider("anthropic", _anthropic)
+    register_lazy_provider("openai", _openai)
@@ -1,14 +1,31 @@
 """Anthropic Claude provider."""
 
+import functools
 import json
 import os
 import time
 import urllib.error
 import urllib.request
+from collections.abc import Callable
 from typing import Any
 
 from ..errors import ProviderError
-from .base import CompletionConfig, CompletionResult
+from .base import _JSON_TYPES, CompletionConfig, CompletionResult
+
+
+@functools.lru_cache(maxsize=256)
+def _schema_tool_properties(
+    fields: tuple[tuple[str, tuple[str, str]], ...],
+) -> tuple[tuple[str, str, str], ...]:
+    """Resolve (field_name, (type, description)) pairs to (name, JSON type, description)."""
+    return tuple(
+        (
+            field_name,
+            _JSON_TYPES.get(field_type, "string"),
+            field_desc or f"The {field_name} field",
+        )
+        for field_name, (field_type, field_desc) in fields
+    )
 
 
 class AnthropicProvider:
@@ -16,50 +33,56 @@ class AnthropicProvider:
 
     name = "anthropic"
 
-    def __init__(self):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        transport: Callable[[dict, str, bool], CompletionResult] | None = None,
+    ):
+        """Create the provider.
+
+        Args:
+            api_key: API key to use instead of ANTHROPIC_API_KEY
+            transport: Callable taking (body, api_key, is_json) that sends the request.
+                Defaults to the built-in HTTP client with retries.
+        """
         self.base_url = os.environ.get("ANTHROPIC_BASE_URL", "https://api.anthropic.com")
         self.api_version = "2023-06-01"
+        self._api_key = api_key
+        self._transport = transport or self._make_request
 
     def _get_api_key(self) -> str:
-        key = os.environ.get("ANTHROPIC_API_KEY")
+        key = self._api_key or os.environ.get("ANTHROPIC_API_KEY")
         if not key:
             raise ProviderError("ANTHROPIC_API_KEY environment variable not set", retryable=False)
         return key
 
     def _build_schema_tool(self, schema: dict[str, tuple[str, str]]) -> dict[str, Any]:
-        """Build a tool definition for structured output."""
-        properties = {}
-        required = []
-
-        for field_name, (field_type, field_desc) in schema.items():
-            json_type = {
-                "string": "string",
-                "number": "number",
-                "boolean": "boolean",
-                "array": "array",
-                "object": "object",
-            }.get(field_type, "string")
-
-            properties[field_name] = {
-                "type": json_type,
-                "description": field_desc or f"The {field_name} field",
-            }
-            required.append(field_name)
+        """Build a tool definition for structured output.
 
+        Field resolution is cached per schema; the returned dict is always new.
+        """
+        properties = _schema_tool_properties(tuple(schema.items()))
         return {
             "name": "structured_output",
             "description": "Return structured output",
             "input_schema": {
                 "type": "object",
-                "properties": properties,
-                "required": required,
+                "properties": {
+                    name: {"type": json_type, "description": desc}
+                    for name, json_type, desc in properties
+                },
+                "required": [name for name, _, _ in properties],
             },
         }
 
     def complete(self, prompt: str, config: CompletionConfig) -> CompletionResult:
         """Execute a completion request to Claude."""
         api_key = self._get_api_key()
+        body = self._build_request_body(prompt, config)
+        return self._transport(body, api_key, config.output_format == "json")
 
+    def _build_request_body(self, prompt: str, config: CompletionConfig) -> dict[str, Any]:
+        """Build the Messages API request body for a prompt."""
         messages = [{"role": "user", "content": prompt}]
 
         body: dict[str, Any] = {
@@ -77,7 +100,7 @@ class AnthropicProvider:
             body["tools"] = [tool]
             body["tool_choice"] = {"type": "tool", "name": "structured_output"}
 
-        return self._make_request(body, api_key, config.output_format == "json")
+        return body
 
     def _make_request(self, body: dict, api_key: str, is_json: bool) -> CompletionResult:
         """Make API request with retry logic."""
@@ -1,10 +1,20 @@
 """Provider protocol and registry."""
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Protocol, runtime_checkable
 
+# Schema field type -> JSON Schema type; unknown types fall back to string
+_JSON_TYPES = {
+    "string": "string",
+    "number": "number",
+    "boolean": "boolean",
+    "array": "array",
+    "object": "object",
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class CompletionConfig:
     """Configuration for a completion request."""
 
@@ -15,7 +25,7 @@ class CompletionConfig:
     output_schema: dict[str, tuple[str, str]] | None = None  # field -> (type, desc)
 
 
-@dataclass
+@dataclass(slots=True)
 class CompletionResult:
     """Result from a completion request."""
 
@@ -38,16 +48,28 @@ class Provider(Protocol):
 class ProviderRegistry:
     """Registry for model providers."""
 
+    __slots__ = ("_providers", "_factories")
+
     def __init__(self):
         self._providers: dict[str, Provider] = {}
+        self._factories: dict[str, Callable[[], Provider]] = {}
 
     def register(self, provider: Provider) -> None:
         """Register a provider."""
+        self._factories.pop(provider.name, None)
         self._providers[provider.name] = provider
 
+    def register_lazy(self, name: str, factory: Callable[[], Provider]) -> None:
+        """Register a provider that is only built (and imported) on first lookup."""
+        self._providers.pop(name, None)
+        self._factories[name] = factory
+
     def get(self, name: str) -> Provider | None:
         """Get a provider by name."""
-        return self._providers.get(name)
+        provider = self._providers.get(name)
+        if provider is None and name in self._factories:
+            provider = self._providers[name] = self._factories.pop(name)()
+        return provider
 
     def get_for_model(self, model_id: str) -> tuple[Provider, str] | None:
         """Get provider and model name from model identifier.
@@ -79,3 +101,8 @@ def get_registry() -> ProviderRegistry:
 def register_provider(provider: Provider) -> None:
     """Register a provider globally."""
     _registry.register(provider)
+
+
+def register_lazy_provider(name: str, factory: Callable[[], Provider]) -> None:
+    """Register a provider globally, deferring factory() until it is first used."""
+    _registry.register_lazy(name, factory)
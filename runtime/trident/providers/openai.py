@@ -8,7 +8,7 @@ import urllib.request
 from typing import Any
 
 from ..errors import ProviderError
-from .base import CompletionConfig, CompletionResult
+from .base import _JSON_TYPES, CompletionConfig, CompletionResult
 
 
 class OpenAIProvider:
@@ -31,13 +31,7 @@ class OpenAIProvider:
         required = []
 
         for field_name, (field_type, field_desc) in schema.items():
-            json_type = {
-                "string": "string",
-                "number": "number",
-                "boolean": "boolean",
-                "array": "array",
-                "object": "object",
-            }.get(field_type, "string")
+            json_type = _JSON_TYPES.get(field_type, "string")
 
             properties[field_name] = {
                 "type": json_type,
@@ -2,6 +2,8 @@
 
 import json
 import sys
+import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -45,7 +47,11 @@ class EventType(Enum):
 
     def to_string(self) -> str:
         """Convert EventType to snake_case string."""
-        return self.value
+        return _EVENT_STRINGS[self]
+
+
+# Precomputed event names; avoids the Enum .value descriptor on every emitted event
+_EVENT_STRINGS: dict[EventType, str] = {e: sys.intern(e.value) for e in EventType}
 
 
 class TelemetryLevel(Enum):
@@ -57,7 +63,7 @@ class TelemetryLevel(Enum):
     ERROR = "ERROR"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TelemetryEvent:
     """A single telemetry event."""
 
@@ -70,16 +76,22 @@ class TelemetryEvent:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert event to JSON-serializable dict."""
-        result = {
+        if self.node_id is None:
+            return {
+                "timestamp": self.timestamp,
+                "run_id": self.run_id,
+                "event": _EVENT_STRINGS[self.event_type],
+                "level": self.level.value,
+                "data": self.data,
+            }
+        return {
             "timestamp": self.timestamp,
             "run_id": self.run_id,
-            "event": self.event_type.to_string(),
+            "event": _EVENT_STRINGS[self.event_type],
             "level": self.level.value,
             "data": self.data,
+            "node_id": self.node_id,
         }
-        if self.node_id is not None:
-            result["node_id"] = self.node_id
-        return result
 
 
 @dataclass
@@ -92,6 +104,25 @@ class TelemetryConfig:
     stdout: bool = True
     level: TelemetryLevel = TelemetryLevel.INFO
     filter_events: list[EventType] | None = None
+    on_event: Callable[[TelemetryEvent], None] | None = None  # In-process event sink
+
+
+# Buffered log files are flushed at least this often while events flow (seconds)
+_FILE_FLUSH_INTERVAL = 1.0
+
+# Lifecycle events after which the log file is flushed immediately, so `tail -f`
+# shows a node as started while it runs; other events wait for the next flush
+_FLUSH_EVENTS = frozenset(
+    {
+        EventType.WORKFLOW_STARTED,
+        EventType.WORKFLOW_COMPLETED,
+        EventType.WORKFLOW_FAILED,
+        EventType.NODE_STARTED,
+        EventType.NODE_COMPLETED,
+        EventType.NODE_FAILED,
+        EventType.NODE_SKIPPED,
+    }
+)
 
 
 class TelemetryEmitter:
@@ -105,22 +136,29 @@ class TelemetryEmitter:
         self,
         config: TelemetryConfig,
         output_stream: TextIO | None = None,
+        on_event: Callable[[TelemetryEvent], None] | None = None,
     ):
         """Initialize telemetry emitter.
 
         Args:
             config: Telemetry configuration
             output_stream: Optional stream for output (default: stdout if config.stdout is True)
+            on_event: Optional callback receiving each event object, unformatted
+                (default: config.on_event). Like output_stream, it replaces stdout output.
         """
         self.config = config
         self._output_stream = output_stream
+        self._on_event = on_event if on_event is not None else config.on_event
+        # One encoder reused for every JSONL line
+        self._encode = json.JSONEncoder(default=str, check_circular=False).encode
         self._file_handle: TextIO | None = None
+        self._last_flush = time.monotonic()
 
-        # Open file if configured
+        # Open file if configured. Writes are block-buffered; see _write_file.
         if config.enabled and config.file_path:
             file_path = Path(config.file_path)
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            self._file_handle = open(file_path, "a", buffering=1)  # Line buffered  # noqa: SIM115
+            self._file_handle = open(file_path, "a", buffering=65536, encoding="utf-8")  # noqa: SIM115
 
     def __enter__(self) -> "TelemetryEmitter":
         """Context manager entry."""
@@ -166,24 +204,43 @@ class TelemetryEmitter:
 
     def _write_event(self, event: TelemetryEvent) -> None:
         """Write an event to configured destinations."""
+        if self._on_event is not None:
+            self._on_event(event)
+
+        stream = self._output_stream
+        if stream is None and self.config.stdout and self._on_event is None:
+            stream = sys.stdout
+        if stream is None and self._file_handle is None:
+            return
+
         if self.config.format == "jsonl":
             output_line = self._format_jsonl(event)
         else:  # human
             output_line = self._format_human(event)
 
-        # Write to stdout if configured
-        if self.config.stdout and self._output_stream is None:
-            print(output_line, file=sys.stdout, flush=True)
-        elif self._output_stream is not None:
-            print(output_line, file=self._output_stream, flush=True)
+        # Write to stdout or the given stream
+        if stream is not None:
+            print(output_line, file=stream, flush=True)
 
         # Write to file if configured
         if self._file_handle:
-            print(output_line, file=self._file_handle, flush=True)
+            self._write_file(self._file_handle, event, output_line)
+
+    def _write_file(self, handle: TextIO, event: TelemetryEvent, output_line: str) -> None:
+        """Append a line to the log file, flushing on lifecycle events, errors, or once a second."""
+        handle.write(output_line + "\n")
+        now = time.monotonic()
+        if (
+            event.event_type in _FLUSH_EVENTS
+            or event.level is TelemetryLevel.ERROR
+            or now - self._last_flush >= _FILE_FLUSH_INTERVAL
+        ):
+            handle.flush()
+            self._last_flush = now
 
     def _format_jsonl(self, event: TelemetryEvent) -> str:
         """Format event as JSON Lines (one JSON object per line)."""
-        return json.dumps(event.to_dict(), default=str)
+        return self._encode(event.to_dict())
 
     def _format_human(self, event: TelemetryEvent) -> str:
         """Format event as human-readable text."""
@@ -1,18 +1,104 @@
 """Python tool execution."""
 
+import functools
 import importlib.util
 import inspect
+import os
+import re
 import sys
+import types
+import zlib
 from pathlib import Path
 from typing import Any
 
 from ..errors import ToolError
-from ..project import ToolDef
+from ..project import Project, ToolDef
+
+
+def _parameter_names(func: Any) -> frozenset[str]:
+    """Return func's parameter names, skipping *args and **kwargs."""
+    # Unwrap functools.wraps decorators: the wrapper's own code is usually a
+    # bare (*args, **kwargs) that says nothing about the tool's parameters.
+    target = inspect.unwrap(func, stop=lambda f: hasattr(f, "__signature__"))
+    if not isinstance(target, types.FunctionType) or hasattr(target, "__signature__"):
+        return _signature_names(func)
+
+    # Plain function: the leading co_varnames are exactly the named
+    # parameters (positional, then keyword-only); *args/**kwargs follow them.
+    code = target.__code__
+    return frozenset(code.co_varnames[: code.co_argcount + code.co_kwonlyargcount])
+
+
+def _signature_names(func: Any) -> frozenset[str]:
+    sig = inspect.signature(func)
+    return frozenset(
+        name
+        for name, param in sig.parameters.items()
+        if param.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    )
+
+
+def _module_name(module_path: str) -> str:
+    """Name a tool module is registered under in ``sys.modules``.
+
+    The prefix keeps tool files such as ``json.py`` or ``email.py`` from
+    shadowing stdlib or third-party modules of the same name. The suffix, a
+    checksum of the path, keeps paths that sanitize alike (``a/b.py`` and
+    ``a_b.py``) apart.
+    """
+    stem = re.sub(r"\W", "_", module_path.removesuffix(".py"))
+    return f"trident_tool_{stem}_{zlib.crc32(module_path.encode()):08x}"
+
+
+# Modification time of each tool module's file when it was last executed,
+# keyed by module name
+_module_mtimes: dict[str, int] = {}
+
+
+def _exec_module(module_name: str, full_path: str | Path) -> Any:
+    """Execute a tool module from its file and register it in ``sys.modules``."""
+    spec = importlib.util.spec_from_file_location(module_name, full_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load module: {full_path}")
+
+    mtime_ns = os.stat(full_path).st_mtime_ns
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        _module_mtimes.pop(module_name, None)
+        raise
+    _module_mtimes[module_name] = mtime_ns
+    return module
+
+
+def cached_import(module_name: str, full_path: str | Path) -> Any:
+    """Return an already-imported tool module, loading it from disk only if needed.
+
+    ``sys.modules`` is consulted first so warm lookups skip the import
+    machinery; an entry is only reused if it was loaded from ``full_path``
+    and the file has not been modified since, matching the invalidation of
+    the introspection cache.
+    """
+    module = sys.modules.get(module_name)
+    if (
+        module is not None
+        and getattr(module, "__file__", None) == str(full_path)
+        and _module_mtimes.get(module_name) == os.stat(full_path).st_mtime_ns
+    ):
+        return module
+    return _exec_module(module_name, full_path)
 
 
 def get_tool_parameters(project_root: Path, tool_def: ToolDef) -> set[str] | None:
     """Introspect a Python tool function to get its parameter names.
 
+    Results are cached per module file, function and modification time, so
+    repeated lookups skip the import and signature inspection until the
+    module is edited. Call ``clear_tool_parameter_cache()`` to reset.
+
     Args:
         project_root: Project root directory
         tool_def: Tool definition
@@ -36,46 +122,69 @@ def get_tool_parameters(project_root: Path, tool_def: ToolDef) -> set[str] | Non
         full_path = (project_root / module_path).resolve()
     else:
         full_path = project_root / "tools" / module_path
-    if not full_path.exists():
+    try:
+        mtime_ns = os.stat(full_path).st_mtime_ns
+    except OSError:
         return None
 
-    try:
-        # Load module
-        spec = importlib.util.spec_from_file_location(
-            module_path.replace(".py", "").replace("/", "."),
-            full_path,
-        )
-        if spec is None or spec.loader is None:
-            return None
+    params = _introspect_parameters(
+        str(full_path),
+        _module_name(module_path),
+        tool_def.function or "execute",
+        mtime_ns,
+    )
+    return None if params is None else set(params)
 
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+
+def preload_tool_parameters(project: Project) -> dict[str, set[str] | None]:
+    """Introspect every Python tool in a project in one pass.
+
+    Results also land in the get_tool_parameters cache, so later per-node
+    lookups are cache hits.
+
+    Returns:
+        Mapping of tool id to its parameter names (None if unknown)
+    """
+    return {
+        tool_def.id: get_tool_parameters(project.root, tool_def)
+        for tool_def in project.tools.values()
+        if tool_def.type == "python"
+    }
+
+
+@functools.lru_cache(maxsize=512)
+def _introspect_parameters(
+    full_path: str, module_name: str, function_name: str, mtime_ns: int
+) -> frozenset[str] | None:
+    """Load a tool module and return its function's parameter names.
+
+    ``mtime_ns`` is unused in the body; it is part of the cache key so that
+    editing the module invalidates the cached result. The module is always
+    executed fresh here and left in ``sys.modules`` for the runner to reuse.
+    """
+    try:
+        module = _exec_module(module_name, full_path)
 
         # Get function
-        function_name = tool_def.function or "execute"
-        func = getattr(module, function_name, None)
-        if func is None or not callable(func):
+        try:
+            func = getattr(module, function_name)
+        except AttributeError:
+            return None
+        if not callable(func):
             return None
 
-        # Introspect signature
-        sig = inspect.signature(func)
-        params = set()
-        for name, param in sig.parameters.items():
-            # Skip *args and **kwargs
-            if param.kind in (
-                inspect.Parameter.VAR_POSITIONAL,
-                inspect.Parameter.VAR_KEYWORD,
-            ):
-                continue
-            params.add(name)
-
-        return params
+        return _parameter_names(func)
 
     except Exception:
         # Introspection failed - return None to indicate unknown
         return None
 
 
+def clear_tool_parameter_cache() -> None:
+    """Forget all cached tool introspection results."""
+    _introspect_parameters.cache_clear()
+
+
 class PythonToolRunner:
     """Executes Python callable tools."""
 
@@ -102,17 +211,7 @@ class PythonToolRunner:
             raise ToolError(f"Tool module not found: {full_path}")
 
         try:
-            spec = importlib.util.spec_from_file_location(
-                module_path.replace(".py", "").replace("/", "."),
-                full_path,
-            )
-            if spec is None or spec.loader is None:
-                raise ToolError(f"Cannot load module: {full_path}")
-
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[spec.name] = module
-            spec.loader.exec_module(module)
-
+            module = cached_import(_module_name(module_path), full_path)
             self._loaded_modules[module_path] = module
             return module
 
@@ -140,8 +239,9 @@ class PythonToolRunner:
 
         try:
             module = self._load_module(module_path)
-            func = getattr(module, function_name, None)
-            if func is None:
+            try:
+                func = getattr(module, function_name)
+            except AttributeError:
                 raise ToolError(f"Function '{function_name}' not found in {module_path}")
             if not callable(func):
                 raise ToolError(f"'{function_name}' in {module_path} is not callable")